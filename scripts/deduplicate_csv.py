@@ -1,27 +1,30 @@
-import pandas as pd
+import csv
 from pathlib import Path
-from datetime import datetime
 
-csv_path = Path(r'c:\Users\rocks\Documents\claude work space\CloseNotice\data\sentiment_history.csv')
+csv_path = Path(__file__).parent.parent / 'data' / 'sentiment_history.csv'
 
 if csv_path.exists():
-    df = pd.read_csv(csv_path)
-    
-    # Convert timestamp to datetime and extract date
-    df['timestamp_dt'] = pd.to_datetime(df['timestamp'])
-    df['date'] = df['timestamp_dt'].dt.date
-    
-    # Sort by timestamp to ensure the latest is last
-    df = df.sort_values('timestamp_dt')
-    
-    # Drop duplicates, keeping the last (most recent) entry for each ticker and date
-    df_clean = df.drop_duplicates(subset=['ticker', 'date'], keep='last')
-    
-    # Remove helper columns
-    df_clean = df_clean.drop(columns=['timestamp_dt', 'date'])
-    
-    # Save back
-    df_clean.to_csv(csv_path, index=False)
-    print(f"Deduplication complete. Removed {len(df) - len(df_clean)} duplicates.")
+    # Stream rows into a last-wins dict keyed by (ticker, date).
+    # ISO timestamps sort lexicographically, so no datetime parsing needed.
+    with open(csv_path, 'r', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        total = 0
+        latest = {}
+        for row in reader:
+            total += 1
+            key = (row['ticker'], row['timestamp'][:10])
+            existing = latest.get(key)
+            if existing is None or row['timestamp'] >= existing['timestamp']:
+                latest[key] = row
+
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        # ISO strings sort chronologically, so a plain string sort keeps
+        # the output in timestamp order without any datetime parsing
+        writer.writerows(sorted(latest.values(), key=lambda r: r['timestamp']))
+
+    print(f"Deduplication complete. Removed {total - len(latest)} duplicates.")
 else:
     print("CSV file not found.")
@@ -11,21 +11,61 @@ Features:
 
 import re
 import json
-from typing import Dict, List
-from groq import Groq
-from tenacity import retry, stop_after_attempt, wait_exponential
+import time
+import functools
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from groq import Groq
 
 from src.config.settings import Settings
-from src.config.tickers import get_sector, MAGNIFICENT_7
+from src.config.tickers import get_sector, get_fund_holdings, MAGNIFICENT_7
 from src.analysis.prompts import (
-    format_aggregate_prompt,
-    format_individual_prompt
+    format_aggregate_prompt_from_text,
+    format_individual_prompt,
+    format_batch_individual_prompt
 )
 from src.utils.logger import setup_logger, log_api_call
 from src.utils.error_handler import InsufficientDataError
 
 logger = setup_logger(__name__)
 
+# orjson parses typical LLM JSON 2-5x faster than stdlib json;
+# fall back silently when it isn't installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# msgspec gives C-speed structural validation for the common case of a
+# well-formed result; the pure-Python checks below remain as the
+# fallback and produce the detailed per-field error messages
+try:
+    import msgspec
+
+    class _SentimentResult(msgspec.Struct):
+        ticker: str
+        sentiment_score: int
+        top_insights: list
+        rationale: str
+
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+@functools.lru_cache(maxsize=256)
+def _sector_for(ticker: str) -> str:
+    """Memoized sector lookup (tickers repeat across analysis calls)."""
+    return get_sector(ticker)
+
+
+# Precompiled patterns for extracting JSON from LLM responses
+# Pattern: ```json ... ``` or ``` ... ```
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+# Fallback: content between first { and last }
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 class GroqClient:
     """Client for Groq LLM API."""
@@ -38,19 +78,32 @@ class GroqClient:
             api_key: Groq API key (defaults to Settings.GROQ_API_KEY)
         """
         self.api_key = api_key or Settings.GROQ_API_KEY
-        self.client = Groq(api_key=self.api_key)
+        self._client = None
         self.model = Settings.GROQ_MODEL
         self.temperature = Settings.GROQ_TEMPERATURE
         self.max_tokens = Settings.GROQ_MAX_TOKENS
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
-    )
+    @property
+    def client(self) -> "Groq":
+        """
+        Groq SDK client, constructed on first use.
+
+        The deferred import + HTTP session setup keeps the heavy SDK out
+        of code paths that instantiate GroqClient but never call the API.
+        """
+        if self._client is None:
+            from groq import Groq
+
+            self._client = Groq(api_key=self.api_key)
+        return self._client
+
     def _call_llm(self, prompt: str) -> str:
         """
         Call Groq LLM API with retry logic.
 
+        Hand-rolled exponential backoff (2s, 4s between 3 attempts) keeps
+        tenacity out of this module's import graph entirely.
+
         Args:
             prompt: Prompt text
 
@@ -60,6 +113,20 @@ class GroqClient:
         Raises:
             Exception: If all retries fail
         """
+        for attempt in range(3):
+            try:
+                return self._call_llm_once(prompt)
+            except Exception:
+                if attempt == 2:
+                    raise
+                wait = min(10, 2 * 2 ** attempt)
+                logger.warning(
+                    f"Groq call failed (attempt {attempt + 1}/3), retrying in {wait}s"
+                )
+                time.sleep(wait)
+
+    def _call_llm_once(self, prompt: str) -> str:
+        """Single Groq API call (wrapped with retries by _call_llm)."""
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -103,31 +170,34 @@ class GroqClient:
         Raises:
             ValueError: If no valid JSON found
         """
-        # Try direct parsing first
-        try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            pass
+        # Happy path: the prompts instruct "Return ONLY the JSON object",
+        # so most responses are bare JSON. Check cheaply before paying
+        # for exception handling or regex scans on non-JSON responses.
+        # (orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError)
+        stripped = response_text.lstrip()
+        if stripped.startswith('{'):
+            try:
+                return _json_loads(stripped)
+            except ValueError:
+                pass
 
         # Try to extract JSON from markdown code blocks
-        # Pattern: ```json ... ``` or ``` ... ```
-        code_block_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        match = re.search(code_block_pattern, response_text, re.DOTALL)
+        match = _CODE_BLOCK_RE.search(response_text)
 
         if match:
             json_str = match.group(1)
             try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
+                return _json_loads(json_str)
+            except ValueError:
                 pass
 
         # Fallback: Extract content between first { and last }
-        match = re.search(r'\{.*\}', response_text, re.DOTALL)
+        match = _JSON_OBJECT_RE.search(response_text)
         if match:
             json_str = match.group(0)
             try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
+                return _json_loads(json_str)
+            except ValueError:
                 logger.error(f"Failed to parse JSON from: {response_text[:200]}")
                 raise ValueError("No valid JSON found in LLM response")
 
@@ -138,6 +208,27 @@ class GroqClient:
         """
         Validate LLM response structure and data types.
         """
+        # Fast path: one C-level structural check for well-formed results.
+        # On any mismatch, fall through to the Python checks below so the
+        # raised ValueError carries the specific field that failed.
+        if _HAS_MSGSPEC:
+            try:
+                typed = msgspec.convert(result, _SentimentResult, strict=False)
+            except msgspec.ValidationError:
+                typed = None
+
+            if (
+                typed is not None
+                and 1 <= typed.sentiment_score <= 10
+                and typed.top_insights
+                and len(typed.rationale) >= 20
+            ):
+                if len(typed.top_insights) < 2:
+                    logger.warning(f"LLM returned only {len(typed.top_insights)} insights")
+                result['sentiment_score'] = typed.sentiment_score
+                result['top_insights'] = typed.top_insights[:3]
+                return result
+
         # 1. Field presence
         required_fields = ['ticker', 'sentiment_score', 'top_insights', 'rationale']
         missing = [f for f in required_fields if f not in result]
@@ -193,36 +284,40 @@ class GroqClient:
         """
         logger.info(f"Analyzing aggregate sentiment for {fund_name} ({len(ticker_news_dict)} active holdings)")
 
-        # Combine all articles from all holdings with sector context
-        all_articles = []
+        # Emit the formatted prompt chunks directly while walking the
+        # news data - the intermediate list-of-dicts had no other
+        # consumer, so fusing the passes halves memory and iteration.
+        # Hoist lookups out of the loop (50 tickers x N articles per call)
+        max_len = Settings.MAX_SUMMARY_LENGTH
+        sector_get = ticker_sectors.get
+
+        article_chunks = []
         for ticker, articles in ticker_news_dict.items():
-            sector = ticker_sectors.get(ticker, "Unknown")
+            sector = sector_get(ticker, "Unknown")
 
             for article in articles:
                 # CRITICAL: Truncate summary to prevent context overflow
                 # 50 tickers × 200 chars ≈ 10,000 chars (safe for Llama 3.1)
-                truncated_summary = article.get('summary', '')[:Settings.MAX_SUMMARY_LENGTH]
+                truncated_summary = article.get('summary', '')[:max_len]
 
-                all_articles.append({
-                    'ticker': ticker,
-                    'sector': sector,
-                    'headline': article.get('headline', ''),
-                    'summary': truncated_summary,
-                    'source': article.get('source', '')
-                })
+                article_chunks.append(
+                    f"\n[{ticker} - {sector}]\n"
+                    f"Headline: {article.get('headline', '')}\n"
+                    f"Summary: {truncated_summary}\n"
+                    f"Source: {article.get('source', '')}\n"
+                )
 
         # Calculate active ticker count
         active_count = len(ticker_news_dict)
         # Dynamic holdings count from get_fund_holdings()
-        from src.config.tickers import get_fund_holdings
         total_holdings = len(get_fund_holdings(fund_name)) or 50
 
-        logger.debug(f"Prepared {len(all_articles)} articles from {active_count} tickers")
+        logger.debug(f"Prepared {len(article_chunks)} articles from {active_count} tickers")
 
         # Format prompt
-        prompt = format_aggregate_prompt(
+        prompt = format_aggregate_prompt_from_text(
             fund_name=fund_name,
-            articles=all_articles,
+            articles_text="".join(article_chunks).strip(),
             active_count=active_count,
             total_holdings=total_holdings
         )
@@ -232,8 +327,10 @@ class GroqClient:
             response_text = self._call_llm(prompt)
             result = self.parse_llm_response(response_text)
 
-            # Check for insufficient data response
-            if "Insufficient Data" in result.get('rationale', ''):
+            # Check for insufficient data response (bind once - the same
+            # field is re-read during validation otherwise)
+            rationale = result.get('rationale', '') or ''
+            if "Insufficient Data" in rationale:
                 logger.warning(f"LLM returned 'Insufficient Data' for {fund_name}")
                 raise InsufficientDataError(f"Insufficient news data for {fund_name} analysis")
 
@@ -269,14 +366,15 @@ class GroqClient:
         logger.info(f"Analyzing individual sentiment for {ticker} ({len(articles)} articles)")
 
         # Get sector for context
-        sector = get_sector(ticker)
+        sector = _sector_for(ticker)
 
         # Truncate article summaries
+        max_len = Settings.MAX_SUMMARY_LENGTH
         truncated_articles = []
         for article in articles:
             truncated_articles.append({
                 'headline': article.get('headline', ''),
-                'summary': article.get('summary', '')[:Settings.MAX_SUMMARY_LENGTH],
+                'summary': article.get('summary', '')[:max_len],
                 'source': article.get('source', '')
             })
 
@@ -292,8 +390,9 @@ class GroqClient:
             response_text = self._call_llm(prompt)
             result = self.parse_llm_response(response_text)
 
-            # Check for insufficient data response
-            if "Insufficient Data" in result.get('rationale', ''):
+            # Check for insufficient data response (bind once)
+            rationale = result.get('rationale', '') or ''
+            if "Insufficient Data" in rationale:
                 logger.warning(f"LLM returned 'Insufficient Data' for {ticker}")
                 raise InsufficientDataError(f"Insufficient news data for {ticker} analysis")
 
@@ -308,6 +407,77 @@ class GroqClient:
             logger.error(f"Failed to analyze {ticker}: {e}")
             raise
 
+    def analyze_individual_batch(
+        self,
+        items: List[tuple]
+    ) -> List[dict]:
+        """
+        Analyze multiple individual stocks in a single LLM call.
+
+        Batching N tickers into one request avoids N round-trips and the
+        per-call rate-limit throttle on the Groq free tier.
+
+        Args:
+            items: List of (ticker, sector, articles) tuples
+
+        Returns:
+            List of validated result dicts (one per ticker that the LLM
+            analyzed successfully; tickers with insufficient data or
+            malformed results are logged and skipped)
+        """
+        logger.info(f"Analyzing batch of {len(items)} tickers in one LLM call")
+
+        # Truncate article summaries per ticker
+        max_len = Settings.MAX_SUMMARY_LENGTH
+        prompt_items = []
+        for ticker, sector, articles in items:
+            truncated = [
+                {
+                    'headline': article.get('headline', ''),
+                    'summary': article.get('summary', '')[:max_len],
+                    'source': article.get('source', '')
+                }
+                for article in articles
+            ]
+            prompt_items.append((ticker, sector, truncated))
+
+        prompt = format_batch_individual_prompt(prompt_items)
+
+        response_text = self._call_llm(prompt)
+        parsed = self.parse_llm_response(response_text)
+
+        raw_results = parsed.get('results')
+        if not isinstance(raw_results, list) or not raw_results:
+            raise ValueError("Batch response missing 'results' list")
+
+        # Map results back to requested tickers (LLMs occasionally
+        # reorder or drop entries)
+        by_ticker = {}
+        for raw in raw_results:
+            if isinstance(raw, dict) and raw.get('ticker'):
+                by_ticker[str(raw['ticker']).upper()] = raw
+
+        results = []
+        for ticker, sector, articles in items:
+            raw = by_ticker.get(ticker.upper())
+
+            if raw is None:
+                logger.warning(f"No batch result returned for {ticker}")
+                continue
+
+            if "Insufficient Data" in raw.get('rationale', ''):
+                logger.warning(f"LLM returned 'Insufficient Data' for {ticker}")
+                continue
+
+            try:
+                result = self._validate_result(raw)
+                logger.info(f"✓ {ticker} batch analysis complete: Score {result['sentiment_score']}/10")
+                results.append(result)
+            except ValueError as e:
+                logger.error(f"Invalid batch result for {ticker}: {e}")
+
+        return results
+
 
 # Convenience functions
 def analyze_fnilx(ticker_news_dict: Dict[str, List[dict]]) -> dict:
@@ -8,6 +8,8 @@ Provides structured prompts with:
 - Industry-specific catalysts for individual stocks
 """
 
+import string
+
 # ============================================================================
 # Aggregate Analysis Prompt (FNILX Fund-Level)
 # ============================================================================
@@ -96,6 +98,80 @@ Focus on: Industry-specific drivers, NOT general market conditions.
 IMPORTANT: Return ONLY the JSON object, no additional text or markdown formatting.
 """
 
+# ============================================================================
+# Batch Individual Analysis Prompt (Multiple Stocks, One Call)
+# ============================================================================
+
+BATCH_INDIVIDUAL_PROMPT = """You are a Senior Equity Analyst. Analyze the news for each of the {count} stocks below INDEPENDENTLY.
+
+{sections}
+
+CRITICAL INSTRUCTIONS:
+1. **Hallucination Guard**: If news for a stock is insufficient or outdated, respond with "Insufficient Data" in that stock's rationale. DO NOT guess based on historical knowledge.
+
+2. **Sector-Specific Focus**: For each stock, focus on industry-specific catalysts for its tagged sector, NOT general market sentiment or macro trends (unless directly impacting the sector).
+
+3. **Independent Analysis**: Do not let one stock's news influence another's score.
+
+Provide analysis for ALL {count} stocks in JSON format, in the same order as the numbered sections:
+{{
+  "results": [
+    {{
+      "ticker": "<ticker>",
+      "sentiment_score": <1-10 integer>,
+      "top_insights": [
+        "Sector-specific catalyst 1",
+        "Sector-specific catalyst 2",
+        "Sector-specific catalyst 3"
+      ],
+      "rationale": "<sector-focused explanation or 'Insufficient Data'>"
+    }}
+  ]
+}}
+
+Sentiment Scale:
+1-3: Bearish (Negative developments, downside risks)
+4-6: Neutral (Mixed news, balanced outlook)
+7-10: Bullish (Positive catalysts, upside potential)
+
+IMPORTANT: Return ONLY the JSON object, no additional text or markdown formatting.
+"""
+
+# ============================================================================
+# Template Pre-Parsing
+# ============================================================================
+
+
+def _compile_template(template: str):
+    """
+    Pre-parse a str.format template into a render function.
+
+    str.format re-walks the whole template on every call — including the
+    literal {{ }} braces in the JSON examples above. Parsing once at
+    import moves that cost out of the per-request path.
+    """
+    parsed = [
+        (literal, field)
+        for literal, field, _spec, _conv in string.Formatter().parse(template)
+    ]
+
+    def render(**kwargs) -> str:
+        parts = []
+        for literal, field in parsed:
+            if literal:
+                parts.append(literal)
+            if field is not None:
+                parts.append(str(kwargs[field]))
+        return "".join(parts)
+
+    return render
+
+
+_render_aggregate = _compile_template(AGGREGATE_PROMPT)
+_render_individual = _compile_template(INDIVIDUAL_PROMPT)
+_render_batch_individual = _compile_template(BATCH_INDIVIDUAL_PROMPT)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -118,17 +194,48 @@ def format_aggregate_prompt(
     Returns:
         Formatted prompt string
     """
-    # Format articles as readable text
-    articles_text = ""
+    # Format articles as readable text (list + join avoids O(N^2) concat)
+    parts = []
     for article in articles:
-        articles_text += f"\n[{article['ticker']} - {article['sector']}]\n"
-        articles_text += f"Headline: {article['headline']}\n"
-        articles_text += f"Summary: {article['summary']}\n"
-        articles_text += f"Source: {article['source']}\n"
+        parts.append(
+            f"\n[{article['ticker']} - {article['sector']}]\n"
+            f"Headline: {article['headline']}\n"
+            f"Summary: {article['summary']}\n"
+            f"Source: {article['source']}\n"
+        )
+
+    return format_aggregate_prompt_from_text(
+        fund_name=fund_name,
+        articles_text="".join(parts).strip(),
+        active_count=active_count,
+        total_holdings=total_holdings
+    )
+
+
+def format_aggregate_prompt_from_text(
+    fund_name: str,
+    articles_text: str,
+    active_count: int,
+    total_holdings: int
+) -> str:
+    """
+    Render the aggregate prompt from pre-formatted article text.
+
+    Callers that already walk the raw news data can emit formatted
+    chunks directly and skip the intermediate list-of-dicts pass.
+
+    Args:
+        fund_name: Fund name (e.g., "FNILX")
+        articles_text: Pre-formatted article block
+        active_count: Number of holdings with news
+        total_holdings: Total number of holdings
 
-    return AGGREGATE_PROMPT.format(
+    Returns:
+        Formatted prompt string
+    """
+    return _render_aggregate(
         fund_name=fund_name,
-        articles=articles_text.strip(),
+        articles=articles_text,
         active_count=active_count,
         total_holdings=total_holdings
     )
@@ -150,20 +257,53 @@ def format_individual_prompt(
     Returns:
         Formatted prompt string
     """
-    # Format articles as readable text
-    articles_text = ""
+    # Format articles as readable text (list + join avoids O(N^2) concat)
+    parts = []
     for article in articles:
-        articles_text += f"\nHeadline: {article.get('headline', 'N/A')}\n"
-        articles_text += f"Summary: {article.get('summary', 'N/A')}\n"
-        articles_text += f"Source: {article.get('source', 'Unknown')}\n"
-
-    return INDIVIDUAL_PROMPT.format(
+        get = article.get
+        parts.append(
+            f"\nHeadline: {get('headline', 'N/A')}\n"
+            f"Summary: {get('summary', 'N/A')}\n"
+            f"Source: {get('source', 'Unknown')}\n"
+        )
+    articles_text = "".join(parts)
+
+    return _render_individual(
         ticker=ticker,
         sector=sector,
         articles=articles_text.strip()
     )
 
 
+def format_batch_individual_prompt(items: list) -> str:
+    """
+    Format the batch analysis prompt covering multiple stocks.
+
+    Args:
+        items: List of (ticker, sector, articles) tuples where articles
+               is a list of dicts with headline, summary, source
+
+    Returns:
+        Formatted prompt string
+    """
+    sections = []
+    for idx, (ticker, sector, articles) in enumerate(items, 1):
+        parts = [f"--- Stock {idx}: {ticker} ({sector}) ---"]
+        for article in articles:
+            get = article.get
+            parts.append(
+                f"Headline: {get('headline', 'N/A')}\n"
+                f"Summary: {get('summary', 'N/A')}\n"
+                f"Source: {get('source', 'Unknown')}"
+            )
+        sections.append("\n".join(parts))
+
+    return _render_batch_individual(
+        count=len(items),
+        sections="\n\n".join(sections)
+    )
+
+
 def get_sentiment_label(score: int) -> str:
     """
     Get sentiment label from score.
@@ -7,12 +7,20 @@ environment variables (production/GitHub Actions) and validates all required set
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Load environment variables from .env file (if it exists)
-# This is for local development - GitHub Actions uses Secrets
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+# This is for local development - GitHub Actions injects Secrets directly,
+# so skip the dotenv import and file parse when the env is already populated
+if not (
+    os.getenv('FINNHUB_API_KEY')
+    and os.getenv('GROQ_API_KEY')
+    and os.getenv('TELEGRAM_BOT_TOKEN')
+    and os.getenv('TELEGRAM_CHAT_ID')
+):
+    from dotenv import load_dotenv
+
+    env_path = Path(__file__).parent.parent.parent / '.env'
+    load_dotenv(dotenv_path=env_path)
 
 
 class Settings:
@@ -53,6 +61,10 @@ class Settings:
     # 1.1 seconds ensures 51 calls take ~56 seconds (under 60/min)
     API_CALL_DELAY = float(os.getenv('API_CALL_DELAY', '1.1'))
 
+    # Worker threads for concurrent news fetching (requests overlap their
+    # round-trips; throughput is still capped by FINNHUB_RATE_LIMIT)
+    FINNHUB_MAX_WORKERS = int(os.getenv('FINNHUB_MAX_WORKERS', '8'))
+
     # Retry configuration for rate limiting
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '5'))
     RETRY_MIN_WAIT = int(os.getenv('RETRY_MIN_WAIT', '2'))  # seconds
@@ -11,39 +11,94 @@ The dictionaries below serve as fallbacks if fetching fails.
 
 Sector tags enable the LLM to provide accurate industry-specific insights
 without having to guess the business model.
+
+Registries load lazily on first access (PEP 562 module __getattr__), so
+importing this module for a helper like is_magnificent_7 no longer pays
+the disk I/O of parsing every cached holdings file.
 """
 
 from typing import Dict, List
 import logging
+import sys
+from functools import lru_cache
 from src.utils.persistence import load_monitored_funds, load_monitored_stocks, load_holdings_cache, save_holdings_cache
 
 logger = logging.getLogger(__name__)
 
 # ============================================================================
-# Ticker registries
+# Ticker registries (created lazily by _ensure_initialized)
 # ============================================================================
 
-FUND_HOLDINGS: Dict[str, Dict[str, str]] = {}
-INDIVIDUAL_TICKERS_WITH_SECTORS: Dict[str, str] = {}
-TICKER_METADATA: Dict[str, str] = {}
-
+# Names populated into globals() on first access:
+#   FUND_HOLDINGS: Dict[str, Dict[str, str]]
+#   INDIVIDUAL_TICKERS_WITH_SECTORS: Dict[str, str]
+#   TICKER_METADATA: Dict[str, str]
+#   _TICKER_SECTOR_INDEX: Dict[str, str]  (flat ticker -> sector so
+#       get_sector is one dict lookup instead of a scan over every fund)
+#   ALL_TICKERS / _ALL_TICKERS_SET / ANALYSIS_TARGETS
+_LAZY_NAMES = frozenset({
+    'FUND_HOLDINGS',
+    'INDIVIDUAL_TICKERS_WITH_SECTORS',
+    'TICKER_METADATA',
+    '_TICKER_SECTOR_INDEX',
+    'ALL_TICKERS',
+    '_ALL_TICKERS_SET',
+    'ANALYSIS_TARGETS',
+})
+
+# Legacy aliases (deprecated) resolved dynamically in __getattr__ so
+# they always reflect current FUND_HOLDINGS; a plain global would go
+# stale the first time the scraper replaced a fund's holdings dict
+_LEGACY_ALIASES = {
+    'FNILX_TOP50_WITH_SECTORS': 'FNILX',
+    'FZILX_TOP40_WITH_SECTORS': 'FZILX',
+}
+
+_INITIALIZED = False
+
+# Keyword -> internal sector label rules, checked in order
+_SECTOR_RULES = (
+    (('tech', 'computation'), 'Tech/General'),
+    (('health', 'pharma'), 'Healthcare/General'),
+    (('financial', 'finance', 'bank'), 'Financials/General'),
+    (('energy', 'oil'), 'Energy/General'),
+    (('consumer', 'retail'), 'Consumer/General'),
+    (('industrial',), 'Industrials/General'),
+    (('utility',), 'Utilities/General'),
+    (('material',), 'Materials/General'),
+    (('estate',), 'RealEstate/General'),
+    (('communication', 'telecom'), 'Tech/Internet'),
+)
+
+@lru_cache(maxsize=512)
 def _map_sector_name(raw_sector: str) -> str:
-    """Map raw sector strings to internal format. (Moved up for use in init)"""
+    """Map raw sector strings to internal format (memoized - raw sector
+    strings repeat heavily across holdings)."""
     s = raw_sector.lower()
-    if 'tech' in s or 'computation' in s: return 'Tech/General'
-    if 'health' in s or 'pharma' in s: return 'Healthcare/General'
-    if 'financial' in s or 'finance' in s or 'bank' in s: return 'Financials/General'
-    if 'energy' in s or 'oil' in s: return 'Energy/General'
-    if 'consumer' in s or 'retail' in s: return 'Consumer/General'
-    if 'industrial' in s: return 'Industrials/General'
-    if 'utility' in s: return 'Utilities/General'
-    if 'material' in s: return 'Materials/General'
-    if 'estate' in s: return 'RealEstate/General'
-    if 'communication' in s or 'telecom' in s: return 'Tech/Internet'
-    return f"Other/{raw_sector.capitalize()}"
-
-def _initialize_from_persistence():
-    """Load monitored funds/stocks and populate holdings from cache."""
+    for keys, label in _SECTOR_RULES:
+        if any(k in s for k in keys):
+            return label
+    return sys.intern(f"Other/{raw_sector.capitalize()}")
+
+def _ensure_initialized():
+    """Load monitored funds/stocks and populate holdings from cache.
+
+    Runs once, on first access to any registry name; guarded so the hot
+    accessors only pay a bool check afterwards.
+    """
+    global _INITIALIZED
+    global FUND_HOLDINGS, INDIVIDUAL_TICKERS_WITH_SECTORS, TICKER_METADATA
+    global _TICKER_SECTOR_INDEX, ALL_TICKERS, _ALL_TICKERS_SET, ANALYSIS_TARGETS
+
+    if _INITIALIZED:
+        return
+    _INITIALIZED = True
+
+    FUND_HOLDINGS = {}
+    INDIVIDUAL_TICKERS_WITH_SECTORS = {}
+    TICKER_METADATA = {}
+    _TICKER_SECTOR_INDEX = {}
+
     # 1. Initialize Funds
     monitored_funds = load_monitored_funds()
     for fund in monitored_funds:
@@ -53,14 +108,17 @@ def _initialize_from_persistence():
             logger.info(f"Loaded {len(cached_holdings)} holdings for {fund} from cache")
             ticker_sectors = {}
             for h in cached_holdings:
-                ticker = h['ticker']
+                # Interned keys: every registry (fund dicts, metadata,
+                # sector index) shares one string object per ticker
+                ticker = sys.intern(h['ticker'])
                 sector = _map_sector_name(h.get('sector', 'Unknown'))
                 name = h.get('name', ticker)
                 ticker_sectors[ticker] = sector
                 if ticker not in TICKER_METADATA:
                     TICKER_METADATA[ticker] = name
             FUND_HOLDINGS[fund] = ticker_sectors
-            
+            _TICKER_SECTOR_INDEX.update(ticker_sectors)
+
     # 2. Initialize Individual Stocks
     monitored_stocks = load_monitored_stocks()
     for ticker in monitored_stocks:
@@ -71,46 +129,86 @@ def _initialize_from_persistence():
         if ticker not in TICKER_METADATA:
             TICKER_METADATA[ticker] = ticker
 
-# Initialize immediately
-_initialize_from_persistence()
+    # Overlay individual-stock sectors with the same precedence the
+    # scraper update path uses: a known sector (e.g. the UURAF special
+    # case) wins over a fund's, but the "Unknown" default never clobbers
+    # a sector a fund already supplied
+    for ticker, sector in INDIVIDUAL_TICKERS_WITH_SECTORS.items():
+        if sector != "Unknown" or ticker not in _TICKER_SECTOR_INDEX:
+            _TICKER_SECTOR_INDEX[ticker] = sector
+
+    ALL_TICKERS = _rebuild_all_tickers()
+
+    # Set mirror of ALL_TICKERS maintained incrementally on fund updates
+    # so each scraper refresh costs O(changed tickers), not O(holdings)
+    _ALL_TICKERS_SET = set(ALL_TICKERS)
+
+    # Analysis targets (Funds + Individual Stocks)
+    ANALYSIS_TARGETS = list(FUND_HOLDINGS.keys()) + list(INDIVIDUAL_TICKERS_WITH_SECTORS.keys())
 
-# Backwards compatibility aliases (deprecated) - ensure they exist even if empty
-FNILX_TOP50_WITH_SECTORS = FUND_HOLDINGS.get("FNILX", {})
-FZILX_TOP40_WITH_SECTORS = FUND_HOLDINGS.get("FZILX", {})
+
+def __getattr__(name: str):
+    """Materialize the lazy registries on first attribute access."""
+    if name in _LAZY_NAMES:
+        _ensure_initialized()
+        return globals()[name]
+    fund = _LEGACY_ALIASES.get(name)
+    if fund is not None:
+        _ensure_initialized()
+        return FUND_HOLDINGS.get(fund, {})
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================================================
 # Aggregated Lists for Pipeline Use
 # ============================================================================
 
+def _resolve_sector(ticker: str) -> str:
+    """Resolve a ticker's sector from the registries (slow path, used
+    when an index entry must be recomputed after a fund drops a ticker).
+
+    Precedence: a known individual-stock sector wins, then any fund
+    holding the ticker, then the "Unknown" individual default.
+    """
+    sector = INDIVIDUAL_TICKERS_WITH_SECTORS.get(ticker, "Unknown")
+    if sector != "Unknown":
+        return sector
+    for holdings in FUND_HOLDINGS.values():
+        fund_sector = holdings.get(ticker)
+        if fund_sector is not None:
+            return fund_sector
+    return sector
+
+
 def _rebuild_all_tickers():
     """Helper to rebuild the ALL_TICKERS list from current holdings."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     tickers = set()
     for holdings in FUND_HOLDINGS.values():
         tickers.update(holdings.keys())
     tickers.update(INDIVIDUAL_TICKERS_WITH_SECTORS.keys())
     return list(tickers)
 
-ALL_TICKERS = _rebuild_all_tickers()
-
-# Analysis targets (Funds + Individual Stocks)
-ANALYSIS_TARGETS = list(FUND_HOLDINGS.keys()) + list(INDIVIDUAL_TICKERS_WITH_SECTORS.keys())
-
 # Magnificent 7 (for breadth analysis in FNILX)
-MAGNIFICENT_7 = ["NVDA", "AAPL", "MSFT", "GOOGL", "AMZN", "META", "TSLA"]
+MAGNIFICENT_7 = frozenset({"NVDA", "AAPL", "MSFT", "GOOGL", "AMZN", "META", "TSLA"})
 
 
 def get_sector(ticker: str) -> str:
     """Get sector tag for a ticker."""
-    # Check all funds
-    for holdings in FUND_HOLDINGS.values():
-        if ticker in holdings:
-            return holdings[ticker]
-            
+    if not _INITIALIZED:
+        _ensure_initialized()
+
+    sector = _TICKER_SECTOR_INDEX.get(ticker)
+    if sector is not None:
+        return sector
+
     return INDIVIDUAL_TICKERS_WITH_SECTORS.get(ticker, "Unknown")
 
 
 def get_company_name(ticker: str) -> str:
     """Get company name for a ticker."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return TICKER_METADATA.get(ticker, ticker)
 
 
@@ -121,24 +219,34 @@ def is_magnificent_7(ticker: str) -> bool:
 
 def get_fnilx_tickers() -> list:
     """Get list of FNILX holdings (Helper for legacy support)."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return list(FUND_HOLDINGS.get("FNILX", {}).keys())
 
 
 def get_fzilx_tickers() -> list:
     """Get list of FZILX holdings (Helper for legacy support)."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return list(FUND_HOLDINGS.get("FZILX", {}).keys())
 
 
 def get_fund_holdings(fund_symbol: str) -> Dict[str, str]:
     """Get holdings dict for a specific fund."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return FUND_HOLDINGS.get(fund_symbol, {})
 
 def get_all_funds() -> List[str]:
     """Get list of all tracked funds."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return list(FUND_HOLDINGS.keys())
 
 def get_individual_tickers() -> list:
     """Get list of individual stocks to track."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     return list(INDIVIDUAL_TICKERS_WITH_SECTORS.keys())
 
 
@@ -150,8 +258,11 @@ def update_fund_holdings_from_scraper(
     Update fund holdings from Scraper data.
     Dynamically registers new funds if they don't exist.
     """
-    global FUND_HOLDINGS, TICKER_METADATA, ALL_TICKERS, ANALYSIS_TARGETS
-    
+    if not _INITIALIZED:
+        _ensure_initialized()
+
+    old_tickers = set(FUND_HOLDINGS.get(fund_symbol, ()))
+
     # Save to cache first
     try:
         save_holdings_cache(fund_symbol, holdings)
@@ -160,7 +271,7 @@ def update_fund_holdings_from_scraper(
 
     ticker_sectors = {}
     for holding in holdings:
-        ticker = holding['ticker']
+        ticker = sys.intern(holding['ticker'])
         raw_sector = holding.get('sector', 'Unknown')
         sector = _map_sector_name(raw_sector)
         name = holding.get('name', ticker)
@@ -171,45 +282,49 @@ def update_fund_holdings_from_scraper(
         if ticker not in TICKER_METADATA:
             TICKER_METADATA[ticker] = name
 
-    # Update or create fund entry
+    # Update or create fund entry (the legacy *_WITH_SECTORS aliases
+    # resolve through __getattr__, so no pointer fixups are needed here)
     FUND_HOLDINGS[fund_symbol] = ticker_sectors
-    
-    # Update legacy pointers if applicable
-    if fund_symbol == "FNILX":
-        global FNILX_TOP50_WITH_SECTORS
-        FNILX_TOP50_WITH_SECTORS = ticker_sectors
-    elif fund_symbol == "FZILX":
-        global FZILX_TOP40_WITH_SECTORS
-        FZILX_TOP40_WITH_SECTORS = ticker_sectors
-
-    # Rebuild aggregates
-    ALL_TICKERS.clear()
-    ALL_TICKERS.extend(_rebuild_all_tickers())
-    
+    # Same precedence as _ensure_initialized: fund sectors fill the
+    # index except where an individual stock has a known sector
+    for ticker, sector in ticker_sectors.items():
+        if INDIVIDUAL_TICKERS_WITH_SECTORS.get(ticker, "Unknown") == "Unknown":
+            _TICKER_SECTOR_INDEX[ticker] = sector
+
+    # Apply the delta to the ticker set and sector index instead of
+    # rebuilding from scratch: drop tickers this fund no longer holds
+    # (unless another fund or the individual list still tracks them),
+    # then add the new
+    new_tickers = set(ticker_sectors)
+    removed = old_tickers - new_tickers
+    if removed:
+        still_tracked = removed & INDIVIDUAL_TICKERS_WITH_SECTORS.keys()
+        for other_fund, other_holdings in FUND_HOLDINGS.items():
+            if other_fund != fund_symbol:
+                still_tracked |= removed & other_holdings.keys()
+        for ticker in removed - still_tracked:
+            _ALL_TICKERS_SET.discard(ticker)
+            _TICKER_SECTOR_INDEX.pop(ticker, None)
+        # Re-resolve survivors: the index may still hold this fund's
+        # now-stale sector for them
+        for ticker in still_tracked:
+            _TICKER_SECTOR_INDEX[ticker] = _resolve_sector(ticker)
+    _ALL_TICKERS_SET.update(new_tickers)
+
+    # Refresh the shared list in place (other modules hold a reference)
+    ALL_TICKERS[:] = _ALL_TICKERS_SET
+
     # Update analysis targets if new fund
     if fund_symbol not in ANALYSIS_TARGETS:
         ANALYSIS_TARGETS.append(fund_symbol)
 
     return ticker_sectors
 
-def _map_sector_name(raw_sector: str) -> str:
-    """Map raw sector strings to internal format."""
-    s = raw_sector.lower()
-    if 'tech' in s or 'computation' in s: return 'Tech/General'
-    if 'health' in s or 'pharma' in s: return 'Healthcare/General'
-    if 'financial' in s or 'finance' in s or 'bank' in s: return 'Financials/General'
-    if 'energy' in s or 'oil' in s: return 'Energy/General'
-    if 'consumer' in s or 'retail' in s: return 'Consumer/General'
-    if 'industrial' in s: return 'Industrials/General'
-    if 'utility' in s: return 'Utilities/General'
-    if 'material' in s: return 'Materials/General'
-    if 'estate' in s: return 'RealEstate/General'
-    if 'communication' in s or 'telecom' in s: return 'Tech/Internet'
-    return f"Other/{raw_sector.capitalize()}"
-
 
 def get_holdings_summary() -> Dict[str, int]:
     """Get summary of current holdings configuration."""
+    if not _INITIALIZED:
+        _ensure_initialized()
     summary = {
         'individual_count': len(INDIVIDUAL_TICKERS_WITH_SECTORS),
         'total_count': len(ALL_TICKERS)
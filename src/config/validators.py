@@ -1,36 +1,104 @@
 import re
+import string
+import sys
+from functools import lru_cache
+from typing import Iterable, Iterator
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Optional Arrow compute path for bulk validation, same pattern as the
+# Parquet cache in persistence: use it when installed, never require it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Below this size the Arrow kernel setup costs more than it saves
+_BULK_THRESHOLD = 64
+
 # Ticker format: 1 to 5 uppercase letters (standard US tickers)
 # This can be expanded if international markets are added (e.g., TSX:RY)
-TICKER_REGEX = re.compile(r'^[A-Z0-9.\-\:]{1,12}$')
+# Anchored with \A/\Z rather than ^/$ - the latter would accept a
+# trailing newline. RE2 (the Arrow bulk path) has no \Z, so it gets the
+# shared body with its own anchors.
+_TICKER_BODY = r'[A-Z0-9.\-\:]{1,12}'
+TICKER_REGEX = re.compile(r'\A' + _TICKER_BODY + r'\Z')
+
+# Delete-table mirroring TICKER_REGEX: translate() drops every allowed
+# character, so a valid ticker translates to the empty string. One C
+# pass over the string, no per-call set construction.
+_DELETE_ALLOWED = str.maketrans('', '', string.ascii_uppercase + string.digits + '.-:')
+
+@lru_cache(maxsize=4096)
+def _is_valid_normalized(clean_ticker: str) -> bool:
+    """Grammar check for an already stripped/uppercased ticker
+    (memoized - the same small symbol universe is validated over and
+    over across fetch batches and refreshes)."""
+    # Fast path: charset check via the delete-table skips the regex
+    # engine entirely for the overwhelmingly common valid case
+    if 1 <= len(clean_ticker) <= 12 and not clean_ticker.translate(_DELETE_ALLOWED):
+        return True
+
+    return TICKER_REGEX.match(clean_ticker) is not None
+
 
 def is_valid_ticker(ticker: str) -> bool:
     """
     Validate the format of a stock/fund ticker symbol.
-    
+
     Args:
         ticker: The ticker symbol to validate.
-        
+
     Returns:
         bool: True if valid, False otherwise.
     """
     if not ticker or not isinstance(ticker, str):
         return False
-        
+
     # Standardize to uppercase for check
-    clean_ticker = ticker.strip().upper()
-    
-    if TICKER_REGEX.match(clean_ticker):
+    if _is_valid_normalized(ticker.strip().upper()):
         return True
-    
+
     logger.warning(f"Invalid ticker format detected: '{ticker}'")
     return False
 
+def iter_valid_tickers(tickers: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily yield the valid tickers from an iterable, normalized and
+    interned.
+
+    Streaming counterpart to validate_ticker_list for large ingests
+    (e.g. watchlists read line-by-line from a file): entries flow to the
+    consumer as they validate instead of materializing the whole result.
+    Each entry normalizes once; like the Arrow bulk path, invalid rows
+    are dropped without the per-element warning log. sys.intern means
+    every duplicate of a symbol downstream shares one str object, so
+    set/dict lookups hit the pointer-identity fast path.
+    """
+    for t in tickers:
+        if isinstance(t, str) and (u := t.strip().upper()) and _is_valid_normalized(u):
+            yield sys.intern(u)
+
+
 def validate_ticker_list(tickers: list) -> list:
     """
-    Filter a list of tickers, returning only the valid ones.
+    Filter a list of tickers, returning only the valid ones (normalized
+    to stripped uppercase and interned).
+
+    Large lists (full-universe scans) validate in one vectorized Arrow
+    regex kernel instead of a Python call per element.
     """
-    return [t for t in tickers if is_valid_ticker(t)]
+    if _HAS_PYARROW and len(tickers) >= _BULK_THRESHOLD:
+        cleaned = [
+            t.strip().upper() if isinstance(t, str) else ''
+            for t in tickers
+        ]
+        mask = pc.match_substring_regex(
+            pa.array(cleaned), '^' + _TICKER_BODY + '$'
+        ).to_pylist()
+        return [sys.intern(c) for c, ok in zip(cleaned, mask) if ok]
+
+    return list(iter_valid_tickers(tickers))
@@ -9,8 +9,14 @@ Features:
 - Retry logic for 429 rate limit errors
 """
 
+import re
 import time
+import threading
 import requests
+from bisect import bisect_right
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from tenacity import (
@@ -34,6 +40,52 @@ class RateLimitError(Exception):
     pass
 
 
+@lru_cache(maxsize=512)
+def _relevance_pattern(ticker: str, company_name: str):
+    """
+    Compiled case-insensitive alternation matching a ticker or company name.
+
+    One regex scan per field replaces four lower() allocations and four
+    substring scans per article; cached since the same ticker is filtered
+    repeatedly across batches.
+    """
+    terms = {ticker}
+    if company_name:
+        terms.add(company_name)
+    # Lookarounds instead of \b: company names like "Apple Inc." end in
+    # a non-word character, after which \b would demand a word character
+    # and the term would never match
+    return re.compile(
+        r'(?<!\w)(?:' + '|'.join(re.escape(t) for t in sorted(terms)) + r')(?!\w)',
+        re.IGNORECASE
+    )
+
+
+class _RequestSpacer:
+    """
+    Thread-safe limiter that spaces request starts by a minimum interval.
+
+    Workers overlap their network round-trips, but request starts stay
+    evenly spaced so overall throughput never exceeds the API quota.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def wait(self):
+        """Block until this thread is allowed to start its request."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+
 class FinnhubClient:
     """Client for interacting with Finnhub API."""
 
@@ -50,6 +102,15 @@ class FinnhubClient:
         if not self.api_key:
             raise APIAuthenticationError("Finnhub API key not configured")
 
+        # Pooled session: one TLS handshake amortized across the whole
+        # batch instead of a fresh connection per request. Pool size
+        # covers the concurrent fetch workers.
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        )
+
     @retry(
         retry=retry_if_exception_type(RateLimitError),
         stop=stop_after_attempt(Settings.MAX_RETRIES),
@@ -97,7 +158,7 @@ class FinnhubClient:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
 
             # Handle rate limiting (429) - will trigger retry
             if response.status_code == 429:
@@ -160,8 +221,6 @@ class FinnhubClient:
         Returns:
             Dict mapping tickers to their articles (ONLY tickers with relevant news)
         """
-        news_data = {}
-
         # Determine lookback period (weekend gap handling)
         today = datetime.now()
         if today.weekday() in [0, 6]:  # Monday=0, Sunday=6
@@ -175,13 +234,39 @@ class FinnhubClient:
 
         logger.info(f"Fetching news from {from_date} to {to_date} for {len(tickers)} tickers")
 
-        # Fetch news for each ticker
-        for idx, ticker in enumerate(tickers, 1):
-            logger.info(f"Processing {idx}/{len(tickers)}: {ticker}")
+        # Overlap network round-trips across a small worker pool. The
+        # shared spacer keeps request starts under the per-minute quota,
+        # so wall time is bounded by the quota instead of the sum of RTTs.
+        spacer = _RequestSpacer(60.0 / max(Settings.FINNHUB_RATE_LIMIT, 1))
+
+        def fetch_one(ticker: str) -> List[dict]:
+            spacer.wait()
+            return self.fetch_company_news(ticker, from_date, to_date)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=Settings.FINNHUB_MAX_WORKERS) as executor:
+            future_map = {
+                executor.submit(fetch_one, ticker): ticker
+                for ticker in tickers
+            }
+
+            for future in as_completed(future_map):
+                ticker = future_map[future]
+
+                try:
+                    articles = future.result()
 
-            try:
-                # Fetch articles
-                articles = self.fetch_company_news(ticker, from_date, to_date)
+                except APIAuthenticationError:
+                    # Critical error - abort entire batch
+                    logger.critical("Finnhub authentication failed - aborting batch fetch")
+                    for pending in future_map:
+                        pending.cancel()
+                    raise
+
+                except Exception as e:
+                    # Log error but continue with other tickers
+                    logger.error(f"Failed to fetch news for {ticker}: {e}")
+                    continue
 
                 if articles:
                     # Apply relevance filtering
@@ -194,26 +279,18 @@ class FinnhubClient:
                     # Only include if relevant articles found
                     if relevant_articles:
                         # Limit to MAX_ARTICLES_PER_TICKER
-                        news_data[ticker] = relevant_articles[:Settings.MAX_ARTICLES_PER_TICKER]
+                        results[ticker] = relevant_articles[:Settings.MAX_ARTICLES_PER_TICKER]
                         logger.info(
                             f"✓ {ticker}: {len(relevant_articles)} relevant articles "
-                            f"(kept {len(news_data[ticker])})"
+                            f"(kept {len(results[ticker])})"
                         )
 
-            except APIAuthenticationError:
-                # Critical error - abort entire batch
-                logger.critical("Finnhub authentication failed - aborting batch fetch")
-                raise
-
-            except Exception as e:
-                # Log error but continue with other tickers
-                logger.error(f"Failed to fetch news for {ticker}: {e}")
-                continue
-
-            finally:
-                # CRITICAL: Preventative delay between ALL requests
-                # This is Layer 1 defense - prevents hitting 30/sec limit
-                time.sleep(Settings.API_CALL_DELAY)
+        # Preserve the caller's ticker order in the returned dict
+        news_data = {
+            ticker: results[ticker]
+            for ticker in tickers
+            if ticker in results
+        }
 
         total_articles = sum(len(articles) for articles in news_data.values())
         logger.info(
@@ -248,20 +325,36 @@ class FinnhubClient:
         # Get company name for better matching
         company_name = ticker_metadata.get(ticker, ticker) if ticker_metadata else ticker
 
-        relevant_articles = []
-
+        pattern = _relevance_pattern(ticker, company_name)
+
+        # One concatenated search document per article (headline + first
+        # 100 chars of summary), all joined into a single blob so the
+        # whole batch is one regex sweep instead of a search call per
+        # article; match offsets map back to article indices via bisect.
+        # Matches cannot cross the newline separator because the terms
+        # never contain one.
+        docs = []
+        offsets = []
+        pos = 0
         for article in articles:
-            headline = article.get('headline', '').lower()
-            summary = article.get('summary', '')[:100].lower()  # First 100 chars only
+            doc = article.get('headline', '') + '\x00' + article.get('summary', '')[:100]
+            docs.append(doc)
+            offsets.append(pos)
+            pos += len(doc) + 1
 
-            # Check if ticker or company name mentioned
-            ticker_mentioned = ticker.lower() in headline or ticker.lower() in summary
-            company_mentioned = company_name.lower() in headline or company_name.lower() in summary
+        matched = set()
+        for match in pattern.finditer('\n'.join(docs)):
+            matched.add(bisect_right(offsets, match.start()) - 1)
 
-            if ticker_mentioned or company_mentioned:
+        relevant_articles = []
+        for index, article in enumerate(articles):
+            if index in matched:
                 relevant_articles.append(article)
             else:
-                logger.debug(f"Filtered irrelevant article for {ticker}: {article.get('headline', '')[:50]}")
+                logger.debug(
+                    f"Filtered irrelevant article for {ticker}: "
+                    f"{article.get('headline', '')[:50]}"
+                )
 
         return relevant_articles
 
@@ -276,13 +369,26 @@ class FinnhubClient:
         Returns:
             Summary dict with counts and metadata
         """
+        # One traversal collects sources and the datetime extremes
+        # instead of three separate passes over the list
+        sources = set()
+        earliest = None
+        latest = 0
+        for article in articles:
+            sources.add(article.get('source', 'Unknown'))
+            timestamp = article.get('datetime', 0)
+            if earliest is None or timestamp < earliest:
+                earliest = timestamp
+            if timestamp > latest:
+                latest = timestamp
+
         return {
             'ticker': ticker,
             'article_count': len(articles),
-            'sources': list(set(article.get('source', 'Unknown') for article in articles)),
+            'sources': list(sources),
             'date_range': {
-                'earliest': min(article.get('datetime', 0) for article in articles) if articles else 0,
-                'latest': max(article.get('datetime', 0) for article in articles) if articles else 0
+                'earliest': earliest if earliest is not None else 0,
+                'latest': latest
             }
         }
 
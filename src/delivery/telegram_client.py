@@ -8,10 +8,18 @@ Features:
 - Support for error notifications
 """
 
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List, Dict
-from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_exponential
+from datetime import date
+from functools import lru_cache
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential_jitter,
+    retry_if_exception
+)
 
 from src.config.settings import Settings
 from src.analysis.prompts import get_sentiment_emoji, get_sentiment_label
@@ -19,10 +27,81 @@ from src.utils.logger import setup_logger, log_api_call
 
 logger = setup_logger(__name__)
 
+# Serialize POST bodies with orjson when available instead of the
+# pure-Python json.dumps inside requests; optional as elsewhere
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Shared bullet prefix for insight and error lines
+_BULLET = "• "
+
+# Scores are integer buckets 0-10, so the emoji and label for every
+# possible score are precomputed once; each report line is then a
+# clamp + tuple index instead of two function calls
+_EMOJI = tuple(get_sentiment_emoji(s) for s in range(11))
+_LABEL = tuple(get_sentiment_label(s) for s in range(11))
+
+# Transient HTTP statuses worth retrying; 4xx (bad token, bad chat id,
+# oversized message) will fail identically on every attempt
+_RETRIABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+@lru_cache(maxsize=1)
+def _format_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime('%b %d, %Y')
+
+
+def _today_str() -> str:
+    """Report-date string, computed once per calendar day.
+
+    Every formatter stamps the same date; keying the cache on the day
+    ordinal keeps it correct for long-running daemons across midnight.
+    """
+    return _format_date(date.today().toordinal())
+
+
+def _is_retriable(exc: BaseException) -> bool:
+    """Retry only on transient network faults and retriable statuses."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    return (
+        isinstance(exc, requests.HTTPError)
+        and exc.response is not None
+        and exc.response.status_code in _RETRIABLE_STATUS
+    )
+
 
 class TelegramClient:
     """Client for sending messages via Telegram Bot API."""
 
+    # Message templates hoisted to class level: the fixed text is built
+    # once at class creation and each send only pays for substitution
+    _HEADER_TMPL = "📊 Daily Analysis - {date}\n\n"
+    _ERROR_HEADER_TMPL = "⚠️ Daily Analysis - {date}\n\n"
+    _FOOTER_ARTICLES = "📊 Articles analyzed: {n}\n"
+    _FOOTER_RUNTIME = "⏱️ Runtime: {m}m {s}s\n"
+    _MARKET_QUIET_TMPL = (
+        "📊 Daily Analysis - {date}\n\n"
+        "🔇 Market Quiet\n\n"
+        "No new news articles found today.\n"
+        "This is likely a weekend or market holiday.\n\n"
+        "Analysis will resume on next trading day."
+    )
+    _ERROR_NOTIF_TMPL = (
+        "❌ Error - {date}\n\n"
+        "{error}\n\n"
+        "Check logs for details."
+    )
+    _TEST_TMPL = (
+        "✅ Telegram Bot Test\n\n"
+        "Your bot is configured correctly!\n"
+        "Chat ID: {chat_id}\n"
+        "Time: {time}"
+    )
+
     def __init__(self, bot_token: str = None, chat_id: str = None):
         """
         Initialize Telegram client.
@@ -35,10 +114,72 @@ class TelegramClient:
         self.chat_id = chat_id or Settings.TELEGRAM_CHAT_ID
         self.base_url = f"{Settings.TELEGRAM_BASE_URL}/bot{self.bot_token}"
 
+        # Keep-alive session: reuses one TLS connection to
+        # api.telegram.org across the report, quiet and error messages
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        )
+
+    # Telegram rejects messages over 4096 chars with a 400 that would
+    # never succeed on retry; split with headroom before sending
+    _MAX_MESSAGE_LEN = 3900
+
+    def close(self):
+        """Release the pooled connections."""
+        self.session.close()
+
+    @classmethod
+    def _split_message(cls, text: str) -> List[str]:
+        """Split an oversized message into chunks at line boundaries."""
+        if len(text) <= cls._MAX_MESSAGE_LEN:
+            return [text]
+
+        chunks = []
+        current = []
+        current_len = 0
+        for line in text.splitlines(keepends=True):
+            if current and current_len + len(line) > cls._MAX_MESSAGE_LEN:
+                chunks.append("".join(current))
+                current = []
+                current_len = 0
+            current.append(line)
+            current_len += len(line)
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10)
+        wait=wait_exponential_jitter(initial=1, max=10),
+        retry=retry_if_exception(_is_retriable),
+        reraise=True
     )
+    def _post_message(self, payload: dict) -> None:
+        """Single send attempt; raises so tenacity can see failures.
+
+        The old decorator never fired because send_message swallowed
+        every exception and returned False. Retries now trigger on
+        connection faults, timeouts and retriable statuses only; 4xx
+        raises through immediately.
+        """
+        url = f"{self.base_url}/sendMessage"
+        if _HAS_ORJSON:
+            response = self.session.post(
+                url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=10
+            )
+        else:
+            response = self.session.post(url, json=payload, timeout=10)
+
+        # Return the connection to the pool immediately rather than
+        # holding the socket until the response is garbage collected
+        with response:
+            response.raise_for_status()
+
     def send_message(self, text: str, parse_mode: str = None) -> bool:
         """
         Send a message to Telegram.
@@ -50,8 +191,6 @@ class TelegramClient:
         Returns:
             True if successful, False otherwise
         """
-        url = f"{self.base_url}/sendMessage"
-
         payload = {
             "chat_id": self.chat_id,
             "text": text
@@ -61,22 +200,16 @@ class TelegramClient:
             payload["parse_mode"] = parse_mode
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
-
-            if response.status_code == 200:
-                log_api_call(logger, "Telegram", "sendMessage", "SUCCESS")
-                logger.info("Message sent to Telegram successfully")
-                return True
-            else:
-                logger.error(f"Telegram API error: {response.status_code} - {response.text}")
-                log_api_call(logger, "Telegram", "sendMessage", "FAILURE")
-                return False
-
+            self._post_message(payload)
         except Exception as e:
             logger.error(f"Failed to send Telegram message: {e}")
             log_api_call(logger, "Telegram", "sendMessage", "FAILURE")
             return False
 
+        log_api_call(logger, "Telegram", "sendMessage", "SUCCESS")
+        logger.info("Message sent to Telegram successfully")
+        return True
+
     def format_report(
         self,
         analysis_results: List[dict],
@@ -98,55 +231,56 @@ class TelegramClient:
         Returns:
             Formatted message string
         """
-        # Header
-        date_str = datetime.now().strftime('%b %d, %Y')
-        message = f"📊 Daily Analysis - {date_str}\n\n"
+        # Build the message as parts + one join: += on str reallocates
+        # the whole buffer on every append
+        date_str = _today_str()
+        parts = [self._HEADER_TMPL.format(date=date_str)]
 
         # Analysis results
         for result in analysis_results:
             ticker = result.get('ticker', 'Unknown')
             score = result.get('sentiment_score', 0)
             insights = result.get('top_insights', [])
-            emoji = get_sentiment_emoji(score)
-            label = get_sentiment_label(score)
+            bucket = max(0, min(10, int(score)))
+            emoji = _EMOJI[bucket]
+            label = _LABEL[bucket]
 
-            # Ticker header
-            
-            
-            if ticker and score:
-                message += f"{emoji} {ticker} | Score: {score}/10 ({label})\n"
+            # Ticker header (unconditional - a 0/10 score is still a
+            # valid result and must keep its header line)
+            parts.append(f"{emoji} {ticker} | Score: {score}/10 ({label})\n")
 
-            # Insights (bullet points)
-            for insight in insights[:3]:  # Max 3 insights
-                message += f"• {insight}\n"
+            # Insights (bullet points, max 3)
+            parts.extend(f"{_BULLET}{insight}\n" for insight in insights[:3])
 
-            message += "\n"
+            parts.append("\n")
 
         # Footer with statistics
-        message += "---\n"
-        message += f"📊 Articles analyzed: {total_articles}\n"
+        parts.append("---\n")
+        parts.append(self._FOOTER_ARTICLES.format(n=total_articles))
 
         if runtime_seconds > 0:
-            runtime_str = f"{int(runtime_seconds // 60)}m {int(runtime_seconds % 60)}s"
-            message += f"⏱️ Runtime: {runtime_str}\n"
+            parts.append(self._FOOTER_RUNTIME.format(
+                m=int(runtime_seconds // 60),
+                s=int(runtime_seconds % 60)
+            ))
 
         # No news section (informational)
         if no_news_tickers:
-            message += f"\nNo news today: {', '.join(no_news_tickers)}\n"
+            parts.append(f"\nNo news today: {', '.join(no_news_tickers)}\n")
 
         # Error summary with details
         if errors:
-            message += f"\n⚠️ {len(errors)} error(s) occurred:\n"
+            parts.append(f"\n⚠️ {len(errors)} error(s) occurred:\n")
             for error in errors:
                 ticker = error.get('ticker', 'Unknown')
                 error_detail = error.get('error', 'Unknown error')
-                message += f"• {ticker}: {error_detail}\n"
-            message += "Check logs for full details\n"
+                parts.append(f"{_BULLET}{ticker}: {error_detail}\n")
+            parts.append("Check logs for full details\n")
         else:
             # Success indicator (only if no errors)
-            message += "\n✅ All analyses successful\n"
+            parts.append("\n✅ All analyses successful\n")
 
-        return message.strip()
+        return "".join(parts).strip()
 
     def format_error_report(
         self,
@@ -165,38 +299,40 @@ class TelegramClient:
         Returns:
             Formatted error message
         """
-        date_str = datetime.now().strftime('%b %d, %Y')
-        message = f"⚠️ Daily Analysis - {date_str}\n\n"
+        date_str = _today_str()
+        parts = [self._ERROR_HEADER_TMPL.format(date=date_str)]
 
         # Show partial results if available
         if partial_results:
-            message += "Partial results:\n\n"
+            parts.append("Partial results:\n\n")
             for result in partial_results:
                 ticker = result.get('ticker', 'Unknown')
                 score = result.get('sentiment_score', 0)
-                emoji = get_sentiment_emoji(score)
-                message += f"{emoji} {ticker} | Score: {score}/10\n"
-                for insight in result.get('top_insights', [])[:2]:
-                    message += f"• {insight}\n"
-                message += "\n"
+                emoji = _EMOJI[max(0, min(10, int(score)))]
+                parts.append(f"{emoji} {ticker} | Score: {score}/10\n")
+                parts.extend(
+                    f"{_BULLET}{insight}\n"
+                    for insight in result.get('top_insights', [])[:2]
+                )
+                parts.append("\n")
 
         # Error summary
-        message += "---\n"
+        parts.append("---\n")
 
         # No news section (informational)
         if no_news_tickers:
-            message += f"\nNo news today: {', '.join(no_news_tickers)}\n"
+            parts.append(f"\nNo news today: {', '.join(no_news_tickers)}\n")
 
         # Error details
-        message += f"\n❌ Errors ({len(errors)}):\n"
-        for error in errors:
-            ticker = error.get('ticker', 'Unknown')
-            error_msg = error.get('error', 'Unknown error')
-            message += f"• {ticker}: {error_msg}\n"
+        parts.append(f"\n❌ Errors ({len(errors)}):\n")
+        parts.extend(
+            f"{_BULLET}{error.get('ticker', 'Unknown')}: {error.get('error', 'Unknown error')}\n"
+            for error in errors
+        )
 
-        message += "\n⚠️ Check logs for details\n"
+        parts.append("\n⚠️ Check logs for details\n")
 
-        return message.strip()
+        return "".join(parts).strip()
 
     def send_daily_report(
         self,
@@ -220,6 +356,11 @@ class TelegramClient:
             True if successful, False otherwise
         """
         try:
+            # Nothing succeeded and nothing failed - that's a quiet
+            # market; skip assembling an empty report entirely
+            if not analysis_results and not errors:
+                return self.send_market_quiet_notification()
+
             # Format report
             if analysis_results and len(analysis_results) > 0:
                 message = self.format_report(
@@ -236,8 +377,9 @@ class TelegramClient:
                     no_news_tickers=no_news_tickers
                 )
 
-            # Send message
-            return self.send_message(message)
+            # Send message, chunked if it exceeds the Telegram cap
+            sent = [self.send_message(chunk) for chunk in self._split_message(message)]
+            return all(sent)
 
         except Exception as e:
             logger.error(f"Failed to send daily report: {e}")
@@ -255,14 +397,8 @@ class TelegramClient:
         Returns:
             True if successful, False otherwise
         """
-        date_str = datetime.now().strftime('%b %d, %Y')
-        message = f"📊 Daily Analysis - {date_str}\n\n"
-        message += "🔇 Market Quiet\n\n"
-        message += "No new news articles found today.\n"
-        message += "This is likely a weekend or market holiday.\n\n"
-        message += "Analysis will resume on next trading day."
-
-        return self.send_message(message)
+        date_str = _today_str()
+        return self.send_message(self._MARKET_QUIET_TMPL.format(date=date_str))
 
     def send_error_notification(self, error_message: str) -> bool:
         """
@@ -274,12 +410,10 @@ class TelegramClient:
         Returns:
             True if successful, False otherwise
         """
-        date_str = datetime.now().strftime('%b %d, %Y')
-        message = f"❌ Error - {date_str}\n\n"
-        message += f"{error_message}\n\n"
-        message += "Check logs for details."
-
-        return self.send_message(message)
+        date_str = _today_str()
+        return self.send_message(
+            self._ERROR_NOTIF_TMPL.format(date=date_str, error=error_message)
+        )
 
     def send_test_message(self) -> bool:
         """
@@ -288,15 +422,25 @@ class TelegramClient:
         Returns:
             True if successful, False otherwise
         """
-        message = "✅ Telegram Bot Test\n\n"
-        message += "Your bot is configured correctly!\n"
-        message += f"Chat ID: {self.chat_id}\n"
-        message += f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return self.send_message(self._TEST_TMPL.format(
+            chat_id=self.chat_id,
+            # time.strftime skips the intermediate datetime object
+            time=time.strftime('%Y-%m-%d %H:%M:%S')
+        ))
+
+
+# Convenience functions share one lazily created client so repeated
+# calls reuse its pooled connection instead of re-handshaking
+_client = None
+
 
-        return self.send_message(message)
+def _get_client() -> TelegramClient:
+    global _client
+    if _client is None:
+        _client = TelegramClient()
+    return _client
 
 
-# Convenience functions
 def send_report(
     results: List[dict],
     total_articles: int = 0,
@@ -315,7 +459,7 @@ def send_report(
     Returns:
         True if successful, False otherwise
     """
-    client = TelegramClient()
+    client = _get_client()
     return client.send_daily_report(
         analysis_results=results,
         total_articles=total_articles,
@@ -326,11 +470,9 @@ def send_report(
 
 def send_market_quiet() -> bool:
     """Send market quiet notification (convenience function)."""
-    client = TelegramClient()
-    return client.send_market_quiet_notification()
+    return _get_client().send_market_quiet_notification()
 
 
 def send_error(error_message: str) -> bool:
     """Send error notification (convenience function)."""
-    client = TelegramClient()
-    return client.send_error_notification(error_message)
+    return _get_client().send_error_notification(error_message)
@@ -13,6 +13,9 @@ Pipeline Flow:
 
 import time
 import sys
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property
 from datetime import datetime
 from typing import List, Dict
 
@@ -22,8 +25,12 @@ from src.config.tickers import (
     FNILX_TOP50_WITH_SECTORS,
     FZILX_TOP40_WITH_SECTORS,
     INDIVIDUAL_TICKERS_WITH_SECTORS,
+    TICKER_METADATA,
     get_fnilx_tickers,
     get_fzilx_tickers,
+    get_all_funds,
+    get_fund_holdings,
+    get_individual_tickers,
     update_fund_holdings_from_scraper,
     get_holdings_summary
 )
@@ -49,14 +56,29 @@ class StockAnalysisPipeline:
     """Main pipeline for stock news analysis."""
 
     def __init__(self):
-        """Initialize pipeline components."""
-        self.finnhub = FinnhubClient()
-        # self.fmp = FmpClient()
-        self.groq = GroqClient()
-        self.csv_logger = SentimentLogger()
-        self.telegram = TelegramClient()
+        """Initialize pipeline state; components are built on first use."""
         self.start_time = time.time()
 
+    # Clients as cached properties: a run that fails validation or
+    # goes market-quiet never pays for the sessions it doesn't touch
+    @cached_property
+    def finnhub(self) -> FinnhubClient:
+        return FinnhubClient()
+
+    # fmp = cached_property(lambda self: FmpClient())
+
+    @cached_property
+    def groq(self) -> GroqClient:
+        return GroqClient()
+
+    @cached_property
+    def csv_logger(self) -> SentimentLogger:
+        return SentimentLogger()
+
+    @cached_property
+    def telegram(self) -> TelegramClient:
+        return TelegramClient()
+
     def run(self) -> bool:
         """
         Execute the full analysis pipeline.
@@ -87,10 +109,9 @@ class StockAnalysisPipeline:
 
             # Step 3: Fetch news for all tickers
             logger.info("\n[Step 3/7] Fetching news from Finnhub...")
-            news_data = self._fetch_all_news()
+            news_data, total_articles = self._fetch_all_news()
 
             # Step 4: Check for market quiet scenario
-            total_articles = sum(len(articles) for articles in news_data.values())
             logger.info(f"✓ News fetched: {len(news_data)} tickers have news ({total_articles} total articles)")
 
             if total_articles == 0:
@@ -135,23 +156,24 @@ class StockAnalysisPipeline:
             self.telegram.send_error_notification(f"Pipeline failed: {str(e)}")
             return False
 
+        finally:
+            # Close only if the client was actually materialized
+            if 'telegram' in self.__dict__:
+                self.telegram.close()
+
     def _fetch_fund_holdings(self):
         """
         Fetch fund holdings from Scraper and update config.
         Includes any extra funds passed via CLI.
         """
-        # Get base funds plus any that were requested via CLI args
-        import sys
-        
         # Check for force refresh flag
         force_refresh = "--refresh" in sys.argv
-        
+
         # Simple CLI parsing for extra funds: python src/main.py SPY QQQ
         # Only add if valid format
         extra_funds = [arg.upper() for arg in sys.argv[1:] if not arg.startswith('-') and is_valid_ticker(arg)]
-        
+
         # Start with default funds from tickers.py
-        from src.config.tickers import get_all_funds, get_fund_holdings
         funds_to_fetch = set(get_all_funds())
         
         # Add extra funds
@@ -180,15 +202,14 @@ class StockAnalysisPipeline:
                 logger.error(f"Error scraping {fund_symbol}: {e}")
 
     @alert_on_failure("Finnhub API Failure")
-    def _fetch_all_news(self) -> Dict[str, List[dict]]:
+    def _fetch_all_news(self) -> tuple[Dict[str, List[dict]], int]:
         """
         Fetch news for all tickers with error handling.
 
         Returns:
-            Dict mapping tickers to their news articles
+            Tuple of (news_data, total article count) so callers don't
+            re-traverse the dict just to count articles
         """
-        from src.config.tickers import TICKER_METADATA
-
         news_data = self.finnhub.batch_fetch_news(
             tickers=ALL_TICKERS,
             ticker_metadata=TICKER_METADATA
@@ -198,7 +219,8 @@ class StockAnalysisPipeline:
         if len(news_data) == 0:
             logger.warning("Zero tickers have news - possible API issue or weekend")
 
-        return news_data
+        total_articles = sum(len(articles) for articles in news_data.values())
+        return news_data, total_articles
 
     def _format_error_detail(self, error: Exception, ticker: str) -> str:
         """
@@ -211,8 +233,6 @@ class StockAnalysisPipeline:
         Returns:
             Formatted error message
         """
-        import requests
-
         error_str = str(error)
 
         # HTTP status code errors
@@ -248,6 +268,21 @@ class StockAnalysisPipeline:
         # Generic error - truncate to 100 chars
         return error_str[:100] + "..." if len(error_str) > 100 else error_str
 
+    def _analysis_error(self, symbol: str, error: Exception) -> dict:
+        """Log a failed analysis and build its error entry."""
+        if isinstance(error, InsufficientDataError):
+            logger.warning(f"Insufficient data for {symbol}: {error}")
+            error_type = 'InsufficientDataError'
+        else:
+            logger.error(f"{symbol} analysis failed: {error}", exc_info=True)
+            error_type = type(error).__name__
+
+        return {
+            'ticker': symbol,
+            'error': self._format_error_detail(error, symbol),
+            'type': error_type
+        }
+
     def _analyze_sentiment(
         self,
         news_data: Dict[str, List[dict]]
@@ -261,99 +296,84 @@ class StockAnalysisPipeline:
         Returns:
             Tuple of (results, errors, no_news_tickers)
         """
-        results = []
-        errors = []
         no_news_tickers = []
 
-        from src.config.tickers import get_fund_holdings, get_all_funds
+        # Each analysis is an independent blocking LLM call, so build
+        # the task list up front and run it on a small thread pool; the
+        # task index preserves the fund-then-individual report order.
+        tasks = []  # (index, symbol, callable)
 
-        # 1. Analyze Funds
+        # 1. Fund aggregates
         for fund_symbol in get_all_funds():
             holdings = get_fund_holdings(fund_symbol)
-            fund_tickers = list(holdings.keys())
-            
+
             # Filter news for this fund
             fund_news = {
                 ticker: news_data[ticker]
-                for ticker in fund_tickers
+                for ticker in holdings
                 if ticker in news_data
             }
 
             if fund_news:
                 logger.info(f"Analyzing {fund_symbol} aggregate ({len(fund_news)} holdings with news)...")
-                try:
-                    fund_result = self.groq.analyze_aggregate_sentiment(
+
+                def analyze_fund(fund_symbol=fund_symbol, fund_news=fund_news, holdings=holdings):
+                    result = self.groq.analyze_aggregate_sentiment(
                         fund_name=fund_symbol,
                         ticker_news_dict=fund_news,
                         ticker_sectors=holdings
                     )
+                    result['news_count'] = sum(len(articles) for articles in fund_news.values())
+                    return result
 
-                    # Add news count
-                    fund_result['news_count'] = sum(len(articles) for articles in fund_news.values())
-
-                    results.append(fund_result)
-                    logger.info(f"✓ {fund_symbol} analysis complete: Score {fund_result['sentiment_score']}/10")
-
-                except InsufficientDataError as e:
-                    logger.warning(f"Insufficient data for {fund_symbol}: {e}")
-                    error_detail = self._format_error_detail(e, fund_symbol)
-                    errors.append({
-                        'ticker': fund_symbol,
-                        'error': error_detail,
-                        'type': 'InsufficientDataError'
-                    })
-
-                except Exception as e:
-                    logger.error(f"{fund_symbol} analysis failed: {e}", exc_info=True)
-                    error_detail = self._format_error_detail(e, fund_symbol)
-                    errors.append({
-                        'ticker': fund_symbol,
-                        'error': error_detail,
-                        'type': type(e).__name__
-                    })
+                tasks.append((len(tasks), fund_symbol, analyze_fund))
             else:
                 logger.info(f"No news for {fund_symbol} holdings - skipping aggregate analysis")
                 no_news_tickers.append(fund_symbol)
 
-        # 2. Analyze Individual Stocks
-        from src.config.tickers import get_individual_tickers
-        
+        # 2. Individual stocks
         for ticker in get_individual_tickers():
             if ticker in news_data:
                 logger.info(f"Analyzing {ticker} ({len(news_data[ticker])} articles)...")
-                try:
-                    stock_result = self.groq.analyze_individual_sentiment(
+
+                def analyze_stock(ticker=ticker, articles=news_data[ticker]):
+                    result = self.groq.analyze_individual_sentiment(
                         ticker=ticker,
-                        articles=news_data[ticker]
+                        articles=articles
                     )
+                    result['news_count'] = len(articles)
+                    return result
 
-                    # Add news count
-                    stock_result['news_count'] = len(news_data[ticker])
-
-                    results.append(stock_result)
-                    logger.info(f"✓ {ticker} analysis complete: Score {stock_result['sentiment_score']}/10")
-
-                except InsufficientDataError as e:
-                    logger.warning(f"Insufficient data for {ticker}: {e}")
-                    error_detail = self._format_error_detail(e, ticker)
-                    errors.append({
-                        'ticker': ticker,
-                        'error': error_detail,
-                        'type': 'InsufficientDataError'
-                    })
-
-                except Exception as e:
-                    logger.error(f"{ticker} analysis failed: {e}", exc_info=True)
-                    error_detail = self._format_error_detail(e, ticker)
-                    errors.append({
-                        'ticker': ticker,
-                        'error': error_detail,
-                        'type': type(e).__name__
-                    })
+                tasks.append((len(tasks), ticker, analyze_stock))
             else:
                 logger.info(f"No news for {ticker} - skipping individual analysis")
                 no_news_tickers.append(ticker)
 
+        indexed_results = {}
+        indexed_errors = {}
+
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                future_map = {
+                    executor.submit(task): (index, symbol)
+                    for index, symbol, task in tasks
+                }
+
+                for future in as_completed(future_map):
+                    index, symbol = future_map[future]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        indexed_errors[index] = self._analysis_error(symbol, e)
+                    else:
+                        indexed_results[index] = result
+                        logger.info(f"✓ {symbol} analysis complete: Score {result['sentiment_score']}/10")
+
+        # Re-impose submission order on the completed futures
+        results = [indexed_results[i] for i in sorted(indexed_results)]
+        errors = [indexed_errors[i] for i in sorted(indexed_errors)]
+
         return results, errors, no_news_tickers
 
     def _log_results(self, results: List[dict], news_data: Dict[str, List[dict]]):
@@ -364,12 +384,11 @@ class StockAnalysisPipeline:
             results: List of analysis results
             news_data: Original news data for news count
         """
-        for result in results:
-            try:
-                self.csv_logger.append_result(result)
-                logger.info(f"✓ Logged {result['ticker']} to CSV")
-            except Exception as e:
-                logger.error(f"Failed to log {result['ticker']} to CSV: {e}")
+        try:
+            self.csv_logger.append_results(results)
+            logger.info(f"✓ Logged {len(results)} results to CSV")
+        except Exception as e:
+            logger.error(f"Failed to log results to CSV: {e}")
 
     def _send_report(
         self,
@@ -8,18 +8,48 @@ Provides:
 - Pandas-based operations for efficiency
 """
 
+import csv
 import os
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from src.config.settings import Settings
 from src.utils.logger import setup_logger
+from src.utils.persistence import iso_now
 
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _load_all(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse the full history once per (path, mtime).
+
+    Keying on the file's mtime means any append invalidates the entry
+    automatically, so trend/latest queries across many tickers in one
+    run share a single parse instead of re-reading the file each.
+    Callers must treat the returned frame as read-only and slice it.
+    """
+    # Declared dtypes let the C engine parse directly into compact
+    # columns: category tickers make equality filters an int8 codes
+    # comparison, nullable Int8 scores absorb the blank cells failed
+    # runs leave, and bool success keeps the filter a bitmap (not
+    # per-row string comparisons)
+    return pd.read_csv(
+        path_str,
+        parse_dates=['timestamp'],
+        dtype={
+            'ticker': 'category',
+            'sentiment_score': 'Int8',
+            'news_count': 'Int32',
+            'success': 'bool',
+        },
+    )
+
+
 class SentimentLogger:
     """Logger for sentiment analysis results."""
 
@@ -33,6 +63,25 @@ class SentimentLogger:
         self.csv_path = csv_path or Settings.SENTIMENT_CSV_PATH
         self._ensure_csv_exists()
 
+        # Lazily built (ticker, date) index so the common append - the
+        # first entry for a ticker on a given day - can stream one row
+        # instead of rewriting the file through pandas
+        self._seen_keys = None
+
+    def _load_seen_keys(self) -> set:
+        """Index existing (ticker, date) pairs for same-day dedup checks."""
+        seen = set()
+        try:
+            with open(self.csv_path, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # skip header
+                for row in reader:
+                    if len(row) >= 2:
+                        seen.add((row[1], row[0][:10]))
+        except Exception as e:
+            logger.error(f"Failed to index sentiment CSV: {e}")
+        return seen
+
     def _ensure_csv_exists(self):
         """Create CSV file with headers if it doesn't exist."""
         if not self.csv_path.exists():
@@ -75,9 +124,38 @@ class SentimentLogger:
         # Format insights as pipe-separated string
         insights_str = "|".join(top_insights) if top_insights else ""
 
-        # Create new row
+        timestamp = iso_now()
+        key = (ticker, timestamp[:10])
+
+        if self._seen_keys is None:
+            self._seen_keys = self._load_seen_keys()
+
+        if key not in self._seen_keys:
+            # Fast path: first entry for this ticker today. Append one
+            # CSV line in O(1) instead of the read-concat-rewrite that
+            # costs O(history) per log call.
+            try:
+                with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerow([
+                        timestamp,
+                        ticker,
+                        sentiment_score if success else '',
+                        insights_str,
+                        rationale,
+                        news_count,
+                        success
+                    ])
+                self._seen_keys.add(key)
+                logger.info(f"Logged sentiment for {ticker}: Score {sentiment_score}/10")
+                return
+            except Exception as e:
+                logger.error(f"Failed to append sentiment to CSV: {e}")
+                raise
+
+        # Same-day duplicate: fall back to the pandas rewrite that keeps
+        # only the latest entry per ticker/day
         new_row = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'ticker': ticker,
             'sentiment_score': sentiment_score if success else None,
             'insights': insights_str,
@@ -109,6 +187,56 @@ class SentimentLogger:
             logger.error(f"Failed to append sentiment to CSV: {e}")
             raise
 
+    def append_results(self, results: List[dict]):
+        """
+        Append a batch of analysis results in one file pass.
+
+        Rows for tickers not yet logged today (the overwhelmingly common
+        case) are streamed with a single open/writerows; same-day
+        duplicates fall back to the per-row dedup rewrite.
+
+        Args:
+            results: Result dicts from sentiment analysis
+        """
+        if not results:
+            return
+
+        if self._seen_keys is None:
+            self._seen_keys = self._load_seen_keys()
+
+        rows = []
+        duplicates = []
+        for result in results:
+            ticker = result.get('ticker', 'Unknown')
+            timestamp = iso_now()
+            key = (ticker, timestamp[:10])
+            if key in self._seen_keys:
+                duplicates.append(result)
+                continue
+            insights = result.get('top_insights', [])
+            rows.append([
+                timestamp,
+                ticker,
+                result.get('sentiment_score', 0),
+                "|".join(insights) if insights else "",
+                result.get('rationale', ''),
+                result.get('news_count', 0),
+                True
+            ])
+            self._seen_keys.add(key)
+
+        if rows:
+            try:
+                with open(self.csv_path, 'a', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(rows)
+            except Exception as e:
+                logger.error(f"Failed to append sentiment batch to CSV: {e}")
+                raise
+            logger.info(f"Logged sentiment for {len(rows)} tickers in one batch")
+
+        for result in duplicates:
+            self.append_result(result)
+
     def append_result(self, result: dict):
         """
         Append analysis result dict to CSV.
@@ -128,6 +256,15 @@ class SentimentLogger:
             success=True
         )
 
+    def as_dataframe(self) -> pd.DataFrame:
+        """
+        Full history as a DataFrame, via the shared mtime-keyed parse.
+
+        Returns the cached frame that load_history slices - treat it as
+        read-only.
+        """
+        return _load_all(str(self.csv_path), self.csv_path.stat().st_mtime_ns)
+
     def load_history(
         self,
         ticker: Optional[str] = None,
@@ -144,10 +281,10 @@ class SentimentLogger:
             DataFrame with historical data
         """
         try:
-            df = pd.read_csv(self.csv_path)
-
-            # Convert timestamp to datetime
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Shared read-through cache: one parse per file version,
+            # sliced per query (boolean masks return copies, so the
+            # cached frame stays pristine)
+            df = _load_all(str(self.csv_path), self.csv_path.stat().st_mtime_ns)
 
             # Filter by date
             cutoff_date = datetime.now() - timedelta(days=days)
@@ -194,8 +331,9 @@ class SentimentLogger:
                 'trend': None
             }
 
-        # Filter successful analyses only
-        df = df[df['success'] == True]
+        # Filter successful analyses only (bool column, so this is a
+        # bitmap index rather than an elementwise == comparison)
+        df = df.loc[df['success'].values]
 
         if df.empty:
             return {
@@ -212,13 +350,16 @@ class SentimentLogger:
         # Calculate statistics
         scores = df['sentiment_score'].dropna()
 
-        # Calculate trend (simple linear regression)
+        # Calculate trend (least-squares slope over entry order, via the
+        # closed form cov(t, y)/var(t) - one vectorized pass instead of
+        # the old two-half mean comparison)
         trend = None
         if len(scores) >= 2:
             # Positive = upward trend, Negative = downward trend
-            first_half_mean = scores.iloc[:len(scores)//2].mean()
-            second_half_mean = scores.iloc[len(scores)//2:].mean()
-            trend = second_half_mean - first_half_mean
+            y = scores.to_numpy(dtype=np.float64)
+            t = np.arange(len(y), dtype=np.float64)
+            t -= t.mean()
+            trend = float((t * (y - y.mean())).sum() / (t * t).sum())
 
         return {
             'ticker': ticker,
@@ -233,6 +374,46 @@ class SentimentLogger:
             'latest_date': df['timestamp'].iloc[-1].strftime('%Y-%m-%d') if len(df) > 0 else None
         }
 
+    # Tail window for get_latest_sentiment: appends land at the end of
+    # the file, so the newest entry for a ticker is almost always here
+    _TAIL_BYTES = 8192
+
+    def _scan_tail(self, ticker: str, cutoff: datetime) -> Optional[dict]:
+        """Find the newest row for ticker in the file's tail, or None."""
+        try:
+            with open(self.csv_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                size = f.tell()
+                f.seek(max(0, size - self._TAIL_BYTES))
+                tail = f.read().decode('utf-8', errors='replace')
+        except OSError:
+            return None
+
+        lines = tail.splitlines()
+        # The first line is the header or a partial row cut by the seek
+        for line in reversed(lines[1:]):
+            row = next(csv.reader([line]), None)
+            if not row or len(row) != 7 or row[1] != ticker:
+                continue
+            try:
+                timestamp = datetime.fromisoformat(row[0])
+            except ValueError:
+                # Continuation of a quoted multi-line field; let the
+                # full-parse fallback handle this file
+                return None
+            if timestamp < cutoff:
+                return None
+            return {
+                'ticker': row[1],
+                'timestamp': pd.Timestamp(timestamp),
+                'sentiment_score': int(row[2]) if row[2] else None,
+                'insights': row[3].split('|') if row[3] else [],
+                'rationale': row[4],
+                'news_count': int(row[5]) if row[5] else 0,
+                'success': row[6] == 'True'
+            }
+        return None
+
     def get_latest_sentiment(self, ticker: str) -> Optional[dict]:
         """
         Get most recent sentiment for a ticker.
@@ -243,7 +424,16 @@ class SentimentLogger:
         Returns:
             Dict with latest sentiment or None if not found
         """
-        df = self.load_history(ticker=ticker, days=7)  # Last week
+        cutoff = datetime.now() - timedelta(days=7)  # Last week
+
+        # Fast path: parse only the last few KB instead of the file
+        latest = self._scan_tail(ticker, cutoff)
+        if latest is not None:
+            return latest
+
+        # Fallback: full (cached) parse, for tickers whose newest entry
+        # predates the tail window or rows with embedded newlines
+        df = self.load_history(ticker=ticker, days=7)
 
         if df.empty:
             return None
@@ -272,7 +462,10 @@ class SentimentLogger:
             Dict with overall statistics
         """
         try:
-            df = pd.read_csv(self.csv_path)
+            # Only three of the seven columns are needed here; skipping
+            # the free-text insights/rationale columns avoids parsing
+            # most of the file's bytes
+            df = pd.read_csv(self.csv_path, usecols=['timestamp', 'ticker', 'success'])
             df['timestamp'] = pd.to_datetime(df['timestamp'])
 
             return {
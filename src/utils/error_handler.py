@@ -7,19 +7,68 @@ Provides:
 - Graceful error handling patterns
 """
 
+import atexit
 import functools
+import queue
+import re
+import threading
 import traceback
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Callable, Any
 from src.config.settings import Settings
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Shared session so bursty alerts reuse one TCP/TLS connection instead
+# of paying a fresh handshake per requests.post
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3)
+))
+
+
+# Alerts drain on a daemon thread so the failing caller re-raises
+# immediately instead of blocking on the HTTP post (started lazily on
+# the first alert)
+_alert_q: queue.Queue = queue.Queue()
+_alert_thread = None
+_alert_lock = threading.Lock()
+
+
+def _ensure_alert_thread():
+    global _alert_thread
+    if _alert_thread is None:
+        with _alert_lock:
+            if _alert_thread is None:
+                thread = threading.Thread(
+                    target=_drain_alerts, daemon=True, name='critical-alerts'
+                )
+                thread.start()
+                # Give queued alerts a chance to flush before exit
+                atexit.register(_alert_q.join)
+                _alert_thread = thread
+
+
+def _drain_alerts():
+    while True:
+        args = _alert_q.get()
+        try:
+            _post_alert(*args)
+        finally:
+            _alert_q.task_done()
+
 
 def send_critical_alert(error_type: str, error_message: str, additional_info: str = ""):
     """
-    Send Telegram alert for critical system failures.
+    Queue a Telegram alert for critical system failures.
+
+    Delivery happens on a background thread, so this returns immediately
+    even if Telegram is slow or unreachable.
 
     Use cases:
     - Finnhub API key expired
@@ -32,6 +81,12 @@ def send_critical_alert(error_type: str, error_message: str, additional_info: st
         error_message: Detailed error message
         additional_info: Additional context (optional)
     """
+    _ensure_alert_thread()
+    _alert_q.put_nowait((error_type, error_message, additional_info))
+
+
+def _post_alert(error_type: str, error_message: str, additional_info: str):
+    """Format and post one alert (runs on the drain thread)."""
     alert_message = f"""
 🚨 CRITICAL SYSTEM ERROR
 
@@ -46,7 +101,7 @@ Time: {_get_timestamp()}
 
     try:
         url = f"{Settings.TELEGRAM_BASE_URL}/bot{Settings.TELEGRAM_BOT_TOKEN}/sendMessage"
-        response = requests.post(
+        response = _SESSION.post(
             url,
             json={
                 "chat_id": Settings.TELEGRAM_CHAT_ID,
@@ -188,20 +243,22 @@ def should_send_critical_alert(error_type: str, error: Exception) -> bool:
     Returns:
         True if critical alert should be sent
     """
-    critical_keywords = [
-        'authentication',
-        'unauthorized',
-        'api key',
-        'expired',
-        'forbidden',
-        'zero news',
-        'no data',
-        'all failed'
-    ]
-
-    error_str = str(error).lower()
-
-    return any(keyword in error_str for keyword in critical_keywords)
+    return _CRITICAL_RE.search(str(error)) is not None
+
+
+# Single alternation so the guard is one scan of the message, not one
+# substring pass per keyword
+_CRITICAL_KEYWORDS = [
+    'authentication',
+    'unauthorized',
+    'api key',
+    'expired',
+    'forbidden',
+    'zero news',
+    'no data',
+    'all failed'
+]
+_CRITICAL_RE = re.compile('|'.join(map(re.escape, _CRITICAL_KEYWORDS)), re.IGNORECASE)
 
 
 def _get_timestamp() -> str:
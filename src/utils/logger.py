@@ -8,37 +8,98 @@ Provides structured logging for the entire application with:
 - Formatted output with timestamps
 """
 
+import atexit
 import logging
+import queue
 import sys
 import re
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from src.config.settings import Settings
 
-class SecretMasker(logging.Filter):
-    """Filter to mask potential API keys and secrets in logs."""
-    
-    # Patterns for common API keys (long alphanumeric strings)
-    # 1. Finnhub/Groq style: Alphanumeric characters, 20-60 chars
-    # 2. General patterns to catch common keys
-    SECRET_PATTERNS = [
-        re.compile(r'gsk_[a-zA-Z0-9]{30,60}'),  # Groq keys
-        re.compile(r'\b[a-zA-Z0-9]{20,50}\b'),   # General long alphanumeric
-    ]
-
-    def filter(self, record):
-        if not isinstance(record.msg, str):
-            return True
-            
-        message = record.msg
-        
-        # Check against patterns
+class MaskingFormatter(logging.Formatter):
+    """Formatter that masks potential API keys and secrets in output.
+
+    Masking happens in format() rather than a logging.Filter so it runs
+    only for records a handler actually emits, and it sees the fully
+    rendered message - including lazily formatted %-args like
+    logger.info("key=%s", secret), which a filter on record.msg misses.
+    """
+
+    # Combined pattern for common API keys (long alphanumeric strings).
+    # The Groq alternative comes first so 'gsk_' prefixed keys mask as a
+    # whole token rather than matching the general branch past the prefix.
+    # 1. Groq style: gsk_ prefix plus 30-60 alphanumerics
+    # 2. General long alphanumeric, 20-50 chars
+    SECRET_PATTERN = re.compile(
+        r'(?:gsk_[a-zA-Z0-9]{30,60}|\b[a-zA-Z0-9]{20,50}\b)'
+    )
+
+    def format(self, record):
         # Note: Be careful not to mask common words or IDs
         # We only mask if it looks like an API key being passed in parameters
-        for pattern in self.SECRET_PATTERNS:
-            message = pattern.sub('[MASKED]', message)
-            
-        record.msg = message
-        return True
+        return self.SECRET_PATTERN.sub('[MASKED]', super().format(record))
+
+
+# Handlers are shared by every logger: one FileHandler means one open
+# descriptor on the log file for the whole process instead of one per
+# setup_logger call (built lazily; the lock guards concurrent first use)
+_handler_lock = threading.Lock()
+_FILE_HANDLER = None
+_CONSOLE_HANDLER = None
+
+
+def _get_shared_handlers():
+    global _FILE_HANDLER, _CONSOLE_HANDLER
+    if _CONSOLE_HANDLER is None:
+        with _handler_lock:
+            if _CONSOLE_HANDLER is None:
+                formatter = MaskingFormatter(Settings.LOG_FORMAT)
+
+                # File handler - logs to file
+                try:
+                    Settings.ensure_directories()
+                    file_handler = logging.FileHandler(Settings.LOG_FILE_PATH, encoding='utf-8')
+                    file_handler.setLevel(logging.DEBUG)  # Log everything to file
+                    file_handler.setFormatter(formatter)
+                    _FILE_HANDLER = file_handler
+                except Exception as e:
+                    print(f"Warning: Could not create file handler: {e}", file=sys.stderr)
+
+                # Console handler - logs to stdout/stderr
+                console_handler = logging.StreamHandler(sys.stdout)
+                console_handler.setLevel(getattr(logging, Settings.LOG_LEVEL.upper()))
+                console_handler.setFormatter(formatter)
+                _CONSOLE_HANDLER = console_handler
+    return _FILE_HANDLER, _CONSOLE_HANDLER
+
+
+# All loggers emit through one QueueHandler; a single QueueListener
+# drains to the real file/console handlers on a background thread, so
+# the logging call on the hot path is just a SimpleQueue.put instead of
+# a synchronous write+flush per record
+_QUEUE_HANDLER = None
+_LISTENER = None
+
+
+def _get_queue_handler():
+    global _QUEUE_HANDLER, _LISTENER
+    if _QUEUE_HANDLER is None:
+        # Build the real handlers before taking the lock (the helper
+        # takes the same, non-reentrant lock)
+        file_handler, console_handler = _get_shared_handlers()
+        with _handler_lock:
+            if _QUEUE_HANDLER is None:
+                log_queue = queue.SimpleQueue()
+                handlers = [h for h in (file_handler, console_handler) if h is not None]
+                _LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+                _LISTENER.start()
+                # Drain and join the listener thread on shutdown so the
+                # last records still reach disk
+                atexit.register(_LISTENER.stop)
+                _QUEUE_HANDLER = QueueHandler(log_queue)
+    return _QUEUE_HANDLER
 
 
 def setup_logger(name: str = __name__, level: str = None) -> logging.Logger:
@@ -64,31 +125,10 @@ def setup_logger(name: str = __name__, level: str = None) -> logging.Logger:
     log_level = level or Settings.LOG_LEVEL
     logger.setLevel(getattr(logging, log_level.upper()))
 
-    # Create formatters
-    formatter = logging.Formatter(Settings.LOG_FORMAT)
-
-    # File handler - logs to file
-    try:
-        Settings.ensure_directories()
-        file_handler = logging.FileHandler(Settings.LOG_FILE_PATH, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)  # Log everything to file
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-    except Exception as e:
-        print(f"Warning: Could not create file handler: {e}", file=sys.stderr)
-
-    # Console handler - logs to stdout/stderr
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
-    
-    # Add masker filter to both handlers
-    masker = SecretMasker()
-    if 'file_handler' in locals():
-        file_handler.addFilter(masker)
-    console_handler.addFilter(masker)
-    
-    logger.addHandler(console_handler)
+    # Attach the process-wide queue handler; per-logger filtering
+    # happens via logger.setLevel above, handler levels are applied by
+    # the listener
+    logger.addHandler(_get_queue_handler())
 
     # Prevent propagation to root logger
     logger.propagate = False
@@ -1,17 +1,93 @@
 import json
 import os
 import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# iso_now caches the second-resolution prefix so burst writes only pay
+# for a strftime once per second; the microsecond suffix keeps
+# timestamps unique within a second (the sentiment dedup sort needs it)
+_last_sec = 0
+_last_prefix = ''
+
+
+def iso_now() -> str:
+    """ISO-8601 local timestamp, cheaper than datetime.now().isoformat()."""
+    global _last_sec, _last_prefix
+    now_ns = time.time_ns()
+    sec = now_ns // 1_000_000_000
+    if sec != _last_sec:
+        _last_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _last_sec = sec
+    return f"{_last_prefix}.{now_ns % 1_000_000_000 // 1000:06d}"
+
+# orjson parses and serializes the config and holdings caches several
+# times faster than stdlib json; optional, stdlib fallback below
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Holdings caches load on every import of src.config.tickers; Parquet
+# skips the per-row JSON decode there. Optional, like orjson elsewhere.
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file with orjson when available."""
+    if _HAS_ORJSON:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: str, data: Any):
+    """Serialize data to a JSON file with orjson when available."""
+    if _HAS_ORJSON:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        # Serialize first so the file sees one write() instead of the
+        # many small chunks json.dump streams out
+        with open(path, 'w') as f:
+            f.write(json.dumps(data, separators=(',', ':')))
+
 # Base directory relative to this file (src/utils/persistence.py)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-DATA_DIR = os.path.join(BASE_DIR, 'data')
-CONFIG_DIR = os.path.join(DATA_DIR, 'config')
-CACHE_DIR = os.path.join(DATA_DIR, 'cache')
-CONFIG_FILE = os.path.join(CONFIG_DIR, 'monitored_items.json')
+
+
+@dataclass
+class _Paths:
+    """All persistence locations, bundled so tests swap one object."""
+    data_dir: str
+    config_dir: str
+    cache_dir: str
+    config_file: str
+
+    @classmethod
+    def under(cls, base_dir: str) -> '_Paths':
+        data_dir = os.path.join(base_dir, 'data')
+        config_dir = os.path.join(data_dir, 'config')
+        return cls(
+            data_dir=data_dir,
+            config_dir=config_dir,
+            cache_dir=os.path.join(data_dir, 'cache'),
+            config_file=os.path.join(config_dir, 'monitored_items.json'),
+        )
+
+
+PATHS = _Paths.under(BASE_DIR)
 
 # Defaults if config doesn't exist
 DEFAULT_FUNDS = ["FNILX", "FZILX"]
@@ -19,51 +95,72 @@ DEFAULT_STOCKS = ["UURAF"]
 
 def ensure_dirs():
     """Ensure data directories exist."""
-    os.makedirs(CONFIG_DIR, exist_ok=True)
-    os.makedirs(CACHE_DIR, exist_ok=True)
+    os.makedirs(PATHS.config_dir, exist_ok=True)
+    os.makedirs(PATHS.cache_dir, exist_ok=True)
 
 def load_monitored_items() -> Dict[str, List[str]]:
     """Load all monitored items (funds and stocks)."""
     ensure_dirs()
-    if not os.path.exists(CONFIG_FILE):
+    if not os.path.exists(PATHS.config_file):
         # Migrating from old funds-only file if it exists
-        old_file = os.path.join(CONFIG_DIR, 'monitored_funds.json')
+        old_file = os.path.join(PATHS.config_dir, 'monitored_funds.json')
         if os.path.exists(old_file):
             try:
-                with open(old_file, 'r') as f:
-                    old_data = json.load(f)
-                    funds = old_data.get('funds', DEFAULT_FUNDS)
-                    save_monitored_items(funds, DEFAULT_STOCKS)
-                    os.remove(old_file)
+                old_data = _read_json(old_file)
+                funds = old_data.get('funds', DEFAULT_FUNDS)
+                save_monitored_items(funds, DEFAULT_STOCKS)
+                os.remove(old_file)
             except Exception:
                 save_monitored_items(DEFAULT_FUNDS, DEFAULT_STOCKS)
         else:
             save_monitored_items(DEFAULT_FUNDS, DEFAULT_STOCKS)
             
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            data = json.load(f)
-            return {
-                'funds': data.get('funds', DEFAULT_FUNDS),
-                'stocks': data.get('stocks', DEFAULT_STOCKS)
-            }
+        data = _cached_load(PATHS.config_file, os.stat(PATHS.config_file).st_mtime_ns)
+        # Fresh lists per call: callers (add_item/remove_item) mutate
+        # the result, and the cached parse must stay pristine
+        return {
+            'funds': list(data.get('funds', DEFAULT_FUNDS)),
+            'stocks': list(data.get('stocks', DEFAULT_STOCKS))
+        }
     except Exception as e:
         logger.error(f"Error loading monitored items: {e}")
         return {'funds': DEFAULT_FUNDS, 'stocks': DEFAULT_STOCKS}
 
+
+@lru_cache(maxsize=1)
+def _cached_load(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the config once per (path, mtime); saves bump the mtime and
+    so invalidate the entry, letting funds/stocks loads share a parse."""
+    return _read_json(path)
+
+# Signature of the last successful write, so repeated saves of an
+# unchanged watchlist (e.g. add_item of an existing symbol) skip disk
+_last_sig = None
+
 def save_monitored_items(funds: List[str], stocks: List[str]):
-    """Save both funds and stocks to monitor."""
+    """Save both funds and stocks to monitor (atomic write)."""
+    global _last_sig
     ensure_dirs()
-    funds = sorted(list(set([f.upper() for f in funds])))
-    stocks = sorted(list(set([s.upper() for s in stocks])))
+    funds = sorted({f.upper() for f in funds})
+    stocks = sorted({s.upper() for s in stocks})
+
+    sig = (PATHS.config_file, tuple(funds), tuple(stocks))
+    if sig == _last_sig and os.path.exists(PATHS.config_file):
+        return
+
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump({
-                'funds': funds, 
-                'stocks': stocks,
-                'updated_at': datetime.now().isoformat()
-            }, f, indent=2)
-        logger.info(f"Saved {len(funds)} funds and {len(stocks)} stocks to {CONFIG_FILE}")
+        # Write to a sibling temp file then rename, so a crash mid-write
+        # can never leave a truncated config behind
+        tmp_file = PATHS.config_file + '.tmp'
+        _write_json(tmp_file, {
+            'funds': funds,
+            'stocks': stocks,
+            'updated_at': iso_now()
+        })
+        os.replace(tmp_file, PATHS.config_file)
+        _last_sig = sig
+        logger.info(f"Saved {len(funds)} funds and {len(stocks)} stocks to {PATHS.config_file}")
     except Exception as e:
         logger.error(f"Error saving monitored items: {e}")
 
@@ -96,33 +193,47 @@ def remove_item(symbol: str) -> Dict[str, List[str]]:
     return items
 
 def save_holdings_cache(ticker: str, holdings: List[Dict[str, Any]]):
-    """Save holdings to cache."""
+    """Save holdings to cache (Parquet when pyarrow is available)."""
     ensure_dirs()
     ticker = ticker.upper()
-    file_path = os.path.join(CACHE_DIR, f"{ticker}_holdings.json")
     try:
-        data = {
-            'ticker': ticker,
-            'updated_at': datetime.now().isoformat(),
-            'holdings': holdings
-        }
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Same temp-file + rename pattern as save_monitored_items: a
+        # crash mid-write leaves the previous cache intact
+        if _HAS_PYARROW and holdings:
+            file_path = os.path.join(PATHS.cache_dir, f"{ticker}_holdings.parquet")
+            pq.write_table(pa.Table.from_pylist(holdings), file_path + '.tmp')
+        else:
+            file_path = os.path.join(PATHS.cache_dir, f"{ticker}_holdings.json")
+            _write_json(file_path + '.tmp', {
+                'ticker': ticker,
+                'updated_at': iso_now(),
+                'holdings': holdings
+            })
+        os.replace(file_path + '.tmp', file_path)
         logger.info(f"Cached holdings for {ticker}")
     except Exception as e:
         logger.error(f"Error caching holdings for {ticker}: {e}")
 
 def load_holdings_cache(ticker: str) -> Optional[List[Dict[str, Any]]]:
-    """Load holdings from cache if exists."""
+    """Load holdings from cache if exists (JSON kept as a read fallback
+    so existing caches survive the Parquet migration)."""
     ticker = ticker.upper()
-    file_path = os.path.join(CACHE_DIR, f"{ticker}_holdings.json")
+
+    if _HAS_PYARROW:
+        parquet_path = os.path.join(PATHS.cache_dir, f"{ticker}_holdings.parquet")
+        if os.path.exists(parquet_path):
+            try:
+                return pq.read_table(parquet_path).to_pylist()
+            except Exception as e:
+                logger.error(f"Error loading Parquet cache for {ticker}: {e}")
+
+    file_path = os.path.join(PATHS.cache_dir, f"{ticker}_holdings.json")
     if not os.path.exists(file_path):
         return None
-        
+
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            return data.get('holdings')
+        data = _read_json(file_path)
+        return data.get('holdings')
     except Exception as e:
         logger.error(f"Error loading cache for {ticker}: {e}")
         return None
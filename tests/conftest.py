@@ -9,12 +9,18 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-@pytest.fixture(autouse=True)
-def fast_retries(monkeypatch):
-    """Reduce retry wait times for faster test execution."""
+@pytest.fixture(scope='session', autouse=True)
+def fast_retries():
+    """Reduce retry wait times for faster test execution.
+
+    Session-scoped: the patch is applied once for the whole run instead
+    of re-patching (and re-importing settings) before every test.
+    """
     from src.config import settings
-    monkeypatch.setattr(settings.Settings, 'RETRY_MIN_WAIT', 0.1)
-    monkeypatch.setattr(settings.Settings, 'RETRY_MAX_WAIT', 0.5)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings.Settings, 'RETRY_MIN_WAIT', 0.1)
+        mp.setattr(settings.Settings, 'RETRY_MAX_WAIT', 0.5)
+        yield
 
 
 @pytest.fixture
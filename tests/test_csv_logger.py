@@ -1,16 +1,18 @@
 import pytest
-import pandas as pd
 from pathlib import Path
 from src.storage.csv_logger import SentimentLogger
 
 @pytest.fixture
 def temp_csv(tmp_path):
+    """Fresh CSV path per test. Must be a distinct path each time: the
+    mtime-keyed read cache in csv_logger would serve one test's frame to
+    the next if the same path were recreated within an mtime granule."""
     return tmp_path / "test_sentiment.csv"
 
 def test_ensure_csv_exists(temp_csv):
     logger = SentimentLogger(csv_path=temp_csv)
     assert temp_csv.exists()
-    df = pd.read_csv(temp_csv)
+    df = logger.as_dataframe()
     assert list(df.columns) == [
         'timestamp', 'ticker', 'sentiment_score', 
         'insights', 'rationale', 'news_count', 'success'
@@ -24,7 +26,7 @@ def test_append_sentiment(temp_csv):
         top_insights=["Bullish"],
         rationale="Growth is strong"
     )
-    df = pd.read_csv(temp_csv)
+    df = logger.as_dataframe()
     assert len(df) == 1
     assert df.iloc[0]['ticker'] == "AAPL"
     assert df.iloc[0]['sentiment_score'] == 8
@@ -35,7 +37,7 @@ def test_deduplication(temp_csv):
     logger.append_sentiment("AAPL", 5, ["A"], "R1")
     logger.append_sentiment("AAPL", 8, ["B"], "R2")
     
-    df = pd.read_csv(temp_csv)
+    df = logger.as_dataframe()
     assert len(df) == 1
     assert df.iloc[0]['sentiment_score'] == 8  # Should keep latest
 
@@ -59,13 +61,49 @@ def test_append_result(temp_csv):
     }
     logger.append_result(result)
 
-    df = pd.read_csv(temp_csv)
+    df = logger.as_dataframe()
     assert len(df) == 1
     assert df.iloc[0]['ticker'] == "FNILX"
     assert df.iloc[0]['sentiment_score'] == 7
     assert "Tech rally" in df.iloc[0]['insights']
 
 
+def test_append_results_batch(temp_csv):
+    """Test batched logging of a fresh result set."""
+    logger = SentimentLogger(csv_path=temp_csv)
+    results = [
+        {"ticker": "FNILX", "sentiment_score": 7, "top_insights": ["Tech rally"],
+         "rationale": "Bullish", "news_count": 42},
+        {"ticker": "NVDA", "sentiment_score": 9, "top_insights": ["GPU demand"],
+         "rationale": "Very bullish", "news_count": 12},
+    ]
+    logger.append_results(results)
+
+    df = logger.as_dataframe()
+    assert len(df) == 2
+    assert sorted(df['ticker']) == ["FNILX", "NVDA"]
+    assert df.loc[df['ticker'] == "NVDA", 'sentiment_score'].iloc[0] == 9
+
+
+def test_append_results_same_day_duplicate(temp_csv):
+    """A (ticker, day) already logged routes through dedup and keeps the latest."""
+    logger = SentimentLogger(csv_path=temp_csv)
+    logger.append_result({"ticker": "AAPL", "sentiment_score": 5,
+                          "top_insights": [], "rationale": "Old", "news_count": 3})
+
+    logger.append_results([
+        {"ticker": "AAPL", "sentiment_score": 8, "top_insights": [],
+         "rationale": "New", "news_count": 6},
+        {"ticker": "MSFT", "sentiment_score": 6, "top_insights": [],
+         "rationale": "Fresh", "news_count": 4},
+    ])
+
+    df = logger.as_dataframe()
+    assert len(df) == 2  # one row per ticker, AAPL deduplicated
+    assert df.loc[df['ticker'] == "AAPL", 'sentiment_score'].iloc[0] == 8
+    assert df.loc[df['ticker'] == "MSFT", 'sentiment_score'].iloc[0] == 6
+
+
 def test_get_sentiment_trend(temp_csv):
     """Test sentiment trend calculation."""
     logger = SentimentLogger(csv_path=temp_csv)
@@ -134,7 +172,7 @@ def test_multiple_tickers(temp_csv):
     logger.append_sentiment("FNILX", 7, ["Tech up"], "Bullish")
     logger.append_sentiment("UURAF", 5, ["Uranium stable"], "Neutral")
 
-    df = pd.read_csv(temp_csv)
+    df = logger.as_dataframe()
     assert len(df) == 2
 
     fnilx_history = logger.load_history(ticker="FNILX")
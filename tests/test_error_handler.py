@@ -1,27 +1,38 @@
 import pytest
-import requests_mock
+from src.config.settings import Settings
+from src.utils import error_handler
 from src.utils.error_handler import (
-    send_critical_alert, 
-    alert_on_failure, 
+    send_critical_alert,
+    alert_on_failure,
     should_send_critical_alert,
     APIAuthenticationError
 )
 
-def test_send_critical_alert_success():
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bot/sendMessage", status_code=200)
-        # This shouldn't raise any exception
-        send_critical_alert("Test Error", "Test Message")
+_ALERT_URL = f"{Settings.TELEGRAM_BASE_URL}/bot{Settings.TELEGRAM_BOT_TOKEN}/sendMessage"
 
-def test_alert_on_failure_decorator():
+def test_send_critical_alert_success(requests_mock):
+    requests_mock.post(_ALERT_URL, status_code=200)
+
+    send_critical_alert("Test Error", "Test Message")
+
+    # Delivery is async - drain the queue while the mock is still active
+    # so the background post hits the mock instead of the real network
+    error_handler._alert_q.join()
+    assert requests_mock.called
+    assert "Test Error" in requests_mock.last_request.json()["text"]
+
+def test_alert_on_failure_decorator(requests_mock):
     @alert_on_failure("Critical Failure")
     def failing_function():
         raise ValueError("Boom")
 
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bot/sendMessage", status_code=200)
-        with pytest.raises(ValueError, match="Boom"):
-            failing_function()
+    requests_mock.post(_ALERT_URL, status_code=200)
+    with pytest.raises(ValueError, match="Boom"):
+        failing_function()
+
+    error_handler._alert_q.join()
+    assert requests_mock.called
+    assert "Critical Failure" in requests_mock.last_request.json()["text"]
 
 def test_should_send_critical_alert():
     assert should_send_critical_alert("Auth", Exception("Authentication failed")) is True
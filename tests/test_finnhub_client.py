@@ -1,17 +1,15 @@
 import pytest
-import requests_mock
 from src.data.finnhub_client import FinnhubClient, RateLimitError
 from src.utils.error_handler import APIAuthenticationError
 
-def test_fetch_company_news_success():
+def test_fetch_company_news_success(requests_mock):
     client = FinnhubClient(api_key="test_key")
-    with requests_mock.Mocker() as m:
-        m.get("https://finnhub.io/api/v1/company-news", json=[{"headline": "Test"}])
-        articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
-        assert len(articles) == 1
-        assert articles[0]["headline"] == "Test"
+    requests_mock.get("https://finnhub.io/api/v1/company-news", json=[{"headline": "Test"}])
+    articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
+    assert len(articles) == 1
+    assert articles[0]["headline"] == "Test"
 
-def test_fetch_company_news_rate_limit():
+def test_fetch_company_news_rate_limit(requests_mock):
     """Test that rate limit errors are raised correctly.
 
     Note: Tenacity wraps the final error in RetryError after exhausting retries.
@@ -20,18 +18,16 @@ def test_fetch_company_news_rate_limit():
     from tenacity import RetryError
     client = FinnhubClient(api_key="test_key")
 
-    with requests_mock.Mocker() as m:
-        m.get("https://finnhub.io/api/v1/company-news", status_code=429)
-        # After exhausting retries, tenacity raises RetryError wrapping RateLimitError
-        with pytest.raises((RateLimitError, RetryError)):
-            client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
+    requests_mock.get("https://finnhub.io/api/v1/company-news", status_code=429)
+    # After exhausting retries, tenacity raises RetryError wrapping RateLimitError
+    with pytest.raises((RateLimitError, RetryError)):
+        client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
 
-def test_fetch_company_news_auth_error():
+def test_fetch_company_news_auth_error(requests_mock):
     client = FinnhubClient(api_key="test_key")
-    with requests_mock.Mocker() as m:
-        m.get("https://finnhub.io/api/v1/company-news", status_code=401)
-        with pytest.raises(APIAuthenticationError):
-            client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
+    requests_mock.get("https://finnhub.io/api/v1/company-news", status_code=401)
+    with pytest.raises(APIAuthenticationError):
+        client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
 
 def test_fetch_company_news_invalid_ticker():
     client = FinnhubClient(api_key="test_key")
@@ -39,22 +35,40 @@ def test_fetch_company_news_invalid_ticker():
         client.fetch_company_news("INVALID_TICKER_NAME", "2023-01-01", "2023-01-02")
 
 
-def test_fetch_company_news_empty_response():
+def test_fetch_company_news_empty_response(requests_mock):
     """Test handling of empty response."""
     client = FinnhubClient(api_key="test_key")
-    with requests_mock.Mocker() as m:
-        m.get("https://finnhub.io/api/v1/company-news", json=[])
-        articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
-        assert articles == []
+    requests_mock.get("https://finnhub.io/api/v1/company-news", json=[])
+    articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
+    assert articles == []
 
 
-def test_fetch_company_news_server_error():
+def test_fetch_company_news_server_error(requests_mock):
     """Test handling of server errors."""
     client = FinnhubClient(api_key="test_key")
-    with requests_mock.Mocker() as m:
-        m.get("https://finnhub.io/api/v1/company-news", status_code=500)
-        articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
-        assert articles == []
+    requests_mock.get("https://finnhub.io/api/v1/company-news", status_code=500)
+    articles = client.fetch_company_news("AAPL", "2023-01-01", "2023-01-02")
+    assert articles == []
+
+
+def test_batch_fetch_news_concurrent(monkeypatch, requests_mock):
+    """Test concurrent batch fetching with relevance filtering."""
+    from src.config.settings import Settings
+    monkeypatch.setattr(Settings, 'FINNHUB_RATE_LIMIT', 60000)
+
+    client = FinnhubClient(api_key="test_key")
+    requests_mock.get(
+        "https://finnhub.io/api/v1/company-news",
+        json=[{"headline": "AAPL stock rises", "summary": "Apple earnings beat"}]
+    )
+    news = client.batch_fetch_news(
+        ["AAPL", "MSFT"],
+        ticker_metadata={"AAPL": "Apple", "MSFT": "Microsoft"}
+    )
+
+    # The mocked article only mentions AAPL/Apple, so MSFT is filtered out
+    assert list(news) == ["AAPL"]
+    assert news["AAPL"][0]["headline"] == "AAPL stock rises"
 
 
 def test_filter_relevant_articles():
@@ -74,6 +88,21 @@ def test_filter_relevant_articles():
     assert any("AAPL" in a.get("headline", "") for a in relevant)
 
 
+def test_filter_relevant_articles_punctuated_company_name():
+    """Company names ending in punctuation (e.g. 'Apple Inc.') must still match."""
+    client = FinnhubClient(api_key="test_key")
+
+    articles = [
+        {"headline": "Apple Inc. announced record iPhone sales", "summary": ""},
+        {"headline": "Fruit harvest hits record levels", "summary": "Orchard news"},
+    ]
+
+    relevant = client._filter_relevant_articles("AAPL", articles, {"AAPL": "Apple Inc."})
+
+    assert len(relevant) == 1
+    assert relevant[0]["headline"].startswith("Apple Inc.")
+
+
 def test_filter_relevant_articles_empty():
     """Test filtering with no articles."""
     client = FinnhubClient(api_key="test_key")
@@ -1,7 +1,7 @@
 import pytest
 from src.analysis.groq_client import GroqClient
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def groq_client():
     return GroqClient(api_key="test_key")
 
@@ -50,6 +50,30 @@ def test_parse_llm_response_json(groq_client):
     parsed = groq_client.parse_llm_response(raw)
     assert parsed["ticker"] == "AAPL"
 
+def test_analyze_individual_batch_maps_results(groq_client, monkeypatch):
+    response = '''{"results": [
+        {"ticker": "AAPL", "sentiment_score": 7, "top_insights": ["A", "B"], "rationale": "Long enough rationale for the test."},
+        {"ticker": "MSFT", "sentiment_score": 4, "top_insights": ["C", "D"], "rationale": "Another long enough rationale here."}
+    ]}'''
+    monkeypatch.setattr(groq_client, "_call_llm", lambda prompt: response)
+
+    items = [
+        ("AAPL", "Tech/Hardware", [{"headline": "h", "summary": "s", "source": "x"}]),
+        ("MSFT", "Tech/Software", [{"headline": "h", "summary": "s", "source": "x"}]),
+    ]
+    results = groq_client.analyze_individual_batch(items)
+    assert [r["ticker"] for r in results] == ["AAPL", "MSFT"]
+    assert results[0]["sentiment_score"] == 7
+
+def test_analyze_individual_batch_skips_insufficient(groq_client, monkeypatch):
+    response = '''{"results": [
+        {"ticker": "AAPL", "sentiment_score": 7, "top_insights": ["A", "B"], "rationale": "Insufficient Data"}
+    ]}'''
+    monkeypatch.setattr(groq_client, "_call_llm", lambda prompt: response)
+
+    items = [("AAPL", "Tech/Hardware", [])]
+    assert groq_client.analyze_individual_batch(items) == []
+
 def test_parse_llm_response_markdown(groq_client):
     raw = 'Some text before\n```json\n{"ticker": "AAPL", "sentiment_score": 5, "top_insights": ["A"], "rationale": "Long enough rationale for test"}\n```\nSome text after'
     parsed = groq_client.parse_llm_response(raw)
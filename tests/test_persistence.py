@@ -10,14 +10,7 @@ from src.utils import persistence
 @pytest.fixture
 def temp_data_dir(tmp_path, monkeypatch):
     """Set up temporary data directories for tests."""
-    data_dir = tmp_path / "data"
-    config_dir = data_dir / "config"
-    cache_dir = data_dir / "cache"
-
-    monkeypatch.setattr(persistence, 'DATA_DIR', str(data_dir))
-    monkeypatch.setattr(persistence, 'CONFIG_DIR', str(config_dir))
-    monkeypatch.setattr(persistence, 'CACHE_DIR', str(cache_dir))
-    monkeypatch.setattr(persistence, 'CONFIG_FILE', str(config_dir / 'monitored_items.json'))
+    monkeypatch.setattr(persistence, 'PATHS', persistence._Paths.under(str(tmp_path)))
 
     return tmp_path
 
@@ -26,8 +19,8 @@ def test_ensure_dirs(temp_data_dir):
     """Test that directories are created."""
     persistence.ensure_dirs()
 
-    assert os.path.exists(persistence.CONFIG_DIR)
-    assert os.path.exists(persistence.CACHE_DIR)
+    assert os.path.exists(persistence.PATHS.config_dir)
+    assert os.path.exists(persistence.PATHS.cache_dir)
 
 
 def test_load_monitored_items_default(temp_data_dir):
@@ -124,6 +117,25 @@ def test_save_and_load_holdings_cache(temp_data_dir):
     assert loaded[0]['ticker'] == "AAPL"
 
 
+def test_holdings_cache_parquet_roundtrip(temp_data_dir):
+    """Parquet cache path writes and reads back when pyarrow is installed.
+
+    Skips otherwise (see requirements-optional.txt).
+    """
+    pytest.importorskip("pyarrow")
+
+    holdings = [
+        {"ticker": "AAPL", "weight": 0.05},
+        {"ticker": "MSFT", "weight": 0.04}
+    ]
+
+    persistence.save_holdings_cache("FNILX", holdings)
+
+    parquet_path = os.path.join(persistence.PATHS.cache_dir, "FNILX_holdings.parquet")
+    assert os.path.exists(parquet_path)
+    assert persistence.load_holdings_cache("FNILX") == holdings
+
+
 def test_load_holdings_cache_not_found(temp_data_dir):
     """Test loading nonexistent cache returns None."""
     result = persistence.load_holdings_cache("NONEXISTENT")
@@ -10,44 +10,24 @@ from src.analysis.prompts import (
 )
 
 
-def test_get_sentiment_label_bearish():
-    """Test bearish sentiment labels."""
-    assert get_sentiment_label(1) == "Bearish"
-    assert get_sentiment_label(2) == "Bearish"
-    assert get_sentiment_label(3) == "Bearish"
-
-
-def test_get_sentiment_label_neutral():
-    """Test neutral sentiment labels."""
-    assert get_sentiment_label(4) == "Neutral"
-    assert get_sentiment_label(5) == "Neutral"
-    assert get_sentiment_label(6) == "Neutral"
-
-
-def test_get_sentiment_label_bullish():
-    """Test bullish sentiment labels."""
-    assert get_sentiment_label(7) == "Bullish"
-    assert get_sentiment_label(8) == "Bullish"
-    assert get_sentiment_label(9) == "Bullish"
-    assert get_sentiment_label(10) == "Bullish"
-
-
-def test_get_sentiment_emoji_bearish():
-    """Test bearish emoji."""
-    assert get_sentiment_emoji(1) == "📉"
-    assert get_sentiment_emoji(3) == "📉"
-
-
-def test_get_sentiment_emoji_neutral():
-    """Test neutral emoji."""
-    assert get_sentiment_emoji(4) == "➖"
-    assert get_sentiment_emoji(6) == "➖"
-
-
-def test_get_sentiment_emoji_bullish():
-    """Test bullish emoji."""
-    assert get_sentiment_emoji(7) == "📈"
-    assert get_sentiment_emoji(10) == "📈"
+@pytest.mark.parametrize('score,label', [
+    (1, "Bearish"), (2, "Bearish"), (3, "Bearish"),
+    (4, "Neutral"), (5, "Neutral"), (6, "Neutral"),
+    (7, "Bullish"), (8, "Bullish"), (9, "Bullish"), (10, "Bullish"),
+])
+def test_get_sentiment_label(score, label):
+    """Test sentiment labels across the score range."""
+    assert get_sentiment_label(score) == label
+
+
+@pytest.mark.parametrize('score,emoji', [
+    (1, "📉"), (3, "📉"),
+    (4, "➖"), (6, "➖"),
+    (7, "📈"), (10, "📈"),
+])
+def test_get_sentiment_emoji(score, emoji):
+    """Test sentiment emoji across the score range."""
+    assert get_sentiment_emoji(score) == emoji
 
 
 def test_format_aggregate_prompt():
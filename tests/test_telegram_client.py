@@ -1,9 +1,8 @@
 import pytest
-import requests_mock
 from src.delivery.telegram_client import TelegramClient
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def telegram_client():
     return TelegramClient(bot_token="test_token", chat_id="test_chat")
 
@@ -23,6 +22,13 @@ def test_format_report_success(telegram_client):
     assert "Articles analyzed: 5" in report
 
 
+def test_format_report_zero_score(telegram_client):
+    """A 0/10 score must still emit the ticker header line."""
+    results = [{"ticker": "AAPL", "sentiment_score": 0, "top_insights": [], "rationale": "R"}]
+    report = telegram_client.format_report(results, total_articles=1)
+    assert "AAPL | Score: 0/10" in report
+
+
 def test_format_report_no_news(telegram_client):
     report = telegram_client.format_report([], total_articles=0, no_news_tickers=["MSFT"])
     assert "No news today: MSFT" in report
@@ -76,50 +82,58 @@ def test_format_error_report_with_partial_results(telegram_client):
     assert "UURAF: Failed" in report
 
 
-def test_send_message_success(telegram_client):
+def test_send_message_success(telegram_client, requests_mock):
     """Test successful message sending."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
-        result = telegram_client.send_message("Test message")
-        assert result is True
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    result = telegram_client.send_message("Test message")
+    assert result is True
 
 
-def test_send_message_failure(telegram_client):
+def test_send_message_failure(telegram_client, requests_mock):
     """Test failed message sending."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", status_code=400)
-        result = telegram_client.send_message("Test message")
-        assert result is False
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", status_code=400)
+    result = telegram_client.send_message("Test message")
+    assert result is False
 
 
-def test_send_daily_report(telegram_client):
+def test_send_daily_report(telegram_client, requests_mock):
     """Test sending daily report."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
-        results = [{"ticker": "FNILX", "sentiment_score": 7, "top_insights": ["A"], "rationale": "R"}]
-        result = telegram_client.send_daily_report(results, total_articles=50)
-        assert result is True
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    results = [{"ticker": "FNILX", "sentiment_score": 7, "top_insights": ["A"], "rationale": "R"}]
+    result = telegram_client.send_daily_report(results, total_articles=50)
+    assert result is True
+
+
+def test_send_daily_report_chunks_long_report(telegram_client, requests_mock):
+    """Reports over the Telegram cap are split into multiple sends."""
+    results = [
+        {"ticker": f"TICK{i}", "sentiment_score": 5, "top_insights": ["x" * 80], "rationale": "R"}
+        for i in range(60)
+    ]
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    result = telegram_client.send_daily_report(results, total_articles=60)
+    assert result is True
+    assert requests_mock.call_count > 1
+    for request in requests_mock.request_history:
+        assert len(request.json()["text"]) <= 4096
 
 
-def test_send_market_quiet_notification(telegram_client):
+def test_send_market_quiet_notification(telegram_client, requests_mock):
     """Test market quiet notification."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
-        result = telegram_client.send_market_quiet_notification()
-        assert result is True
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    result = telegram_client.send_market_quiet_notification()
+    assert result is True
 
 
-def test_send_error_notification(telegram_client):
+def test_send_error_notification(telegram_client, requests_mock):
     """Test error notification."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
-        result = telegram_client.send_error_notification("Test error message")
-        assert result is True
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    result = telegram_client.send_error_notification("Test error message")
+    assert result is True
 
 
-def test_send_test_message(telegram_client):
+def test_send_test_message(telegram_client, requests_mock):
     """Test test message functionality."""
-    with requests_mock.Mocker() as m:
-        m.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
-        result = telegram_client.send_test_message()
-        assert result is True
+    requests_mock.post("https://api.telegram.org/bottest_token/sendMessage", json={"ok": True})
+    result = telegram_client.send_test_message()
+    assert result is True
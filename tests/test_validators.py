@@ -1,25 +1,44 @@
 import pytest
 from src.config.validators import is_valid_ticker, validate_ticker_list
 
-def test_is_valid_ticker_standard():
-    assert is_valid_ticker("AAPL") is True
-    assert is_valid_ticker("MSFT") is True
-    assert is_valid_ticker("BRK.B") is True
-    assert is_valid_ticker("AMD") is True
-
-def test_is_valid_ticker_international():
-    assert is_valid_ticker("SWX:ROG") is True
-    assert is_valid_ticker("LON:AZN") is True
-    assert is_valid_ticker("TSX:RY") is True
-
-def test_is_valid_ticker_invalid():
-    assert is_valid_ticker("TOOLONGTICKER") is False
-    assert is_valid_ticker("aapl") is True  # Should be True because it strips and uppers
-    assert is_valid_ticker("") is False
-    assert is_valid_ticker(None) is False
-    assert is_valid_ticker("!!!") is False
+@pytest.mark.parametrize("ticker,expected", [
+    # Standard US tickers
+    ("AAPL", True),
+    ("MSFT", True),
+    ("BRK.B", True),
+    ("AMD", True),
+    # International (exchange-prefixed)
+    ("SWX:ROG", True),
+    ("LON:AZN", True),
+    ("TSX:RY", True),
+    # Invalid formats
+    ("TOOLONGTICKER", False),
+    ("aapl", True),  # Should be True because it strips and uppers
+    ("", False),
+    (None, False),
+    ("!!!", False),
+])
+def test_is_valid_ticker(ticker, expected):
+    if expected:
+        assert is_valid_ticker(ticker)
+    else:
+        assert not is_valid_ticker(ticker)
 
 def test_validate_ticker_list():
     tickers = ["AAPL", "INVALID!!!", "MSFT", "TOO_LONG_TICKER"]
     valid_tickers = validate_ticker_list(tickers)
     assert valid_tickers == ["AAPL", "MSFT"]
+
+def test_validate_ticker_list_bulk_path():
+    """The Arrow bulk path must agree with the scalar path.
+
+    Skips when pyarrow isn't installed (see requirements-optional.txt).
+    """
+    pytest.importorskip("pyarrow")
+    from src.config.validators import _BULK_THRESHOLD
+
+    tickers = ["AAPL", "INVALID!!!", " msft ", None, "BRK.B", "SWX:ROG"] * _BULK_THRESHOLD
+    assert len(tickers) >= _BULK_THRESHOLD
+
+    expected = ["AAPL", "MSFT", "BRK.B", "SWX:ROG"] * _BULK_THRESHOLD
+    assert validate_ticker_list(tickers) == expected